@@ -4,9 +4,11 @@ Handles PostgreSQL connections (local and Cloud SQL)
 """
 
 import os
-from typing import Optional, Dict, Any
-from contextlib import contextmanager
+import asyncio
+from typing import Optional, Dict, Any, Set
+from contextlib import contextmanager, asynccontextmanager
 import asyncpg
+import orjson
 from asyncpg import Pool, Connection
 
 # Database configuration
@@ -18,12 +20,43 @@ DB_CONFIG = {
     "password": os.getenv("DB_PASSWORD", ""),
 }
 
+# Connection pool sizing (tuned for FastAPI's concurrency)
+POOL_CONFIG = {
+    "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "5")),
+    "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "20")),
+    "max_queries": int(os.getenv("DB_POOL_MAX_QUERIES", "50000")),
+    "max_inactive_connection_lifetime": float(os.getenv("DB_POOL_MAX_IDLE_SECONDS", "600")),
+    # asyncpg's per-connection prepared statement cache: hot queries are
+    # parsed and planned once per connection, and re-prepared automatically
+    # after schema changes
+    "statement_cache_size": int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256")),
+}
+
 # Cloud SQL configuration (when deployed)
 CLOUD_SQL_CONNECTION_NAME = os.getenv("CLOUD_SQL_CONNECTION_NAME")  # "velo-479115:us-central1:velo-db"
 
 # Connection pool
 _pool: Optional[Pool] = None
 
+# Connection releases running in the background (see acquire_release_later)
+_pending_releases: Set[asyncio.Task] = set()
+
+
+async def _init_connection(conn: Connection):
+    """
+    Prepare a freshly opened pool connection
+
+    Registers orjson codecs so JSON/JSONB columns accept and return
+    Python dicts directly.
+    """
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=lambda value: orjson.dumps(value).decode(),
+            decoder=orjson.loads,
+            schema="pg_catalog"
+        )
+
 
 async def init_db_pool() -> Pool:
     """
@@ -46,15 +79,15 @@ async def init_db_pool() -> Pool:
             database=DB_CONFIG["database"],
             user=DB_CONFIG["user"],
             password=DB_CONFIG["password"],
-            min_size=2,
-            max_size=10,
+            init=_init_connection,
+            **POOL_CONFIG,
         )
     else:
         # Use TCP connection for local development
         _pool = await asyncpg.create_pool(
             **DB_CONFIG,
-            min_size=2,
-            max_size=10,
+            init=_init_connection,
+            **POOL_CONFIG,
         )
 
     print(f"✅ Database pool initialized: {DB_CONFIG['database']}")
@@ -64,6 +97,8 @@ async def init_db_pool() -> Pool:
 async def close_db_pool():
     """Close database connection pool"""
     global _pool
+    if _pending_releases:
+        await asyncio.gather(*_pending_releases, return_exceptions=True)
     if _pool is not None:
         await _pool.close()
         _pool = None
@@ -82,6 +117,28 @@ def get_pool() -> Pool:
     return _pool
 
 
+@asynccontextmanager
+async def acquire_release_later():
+    """
+    Acquire a pool connection and hand it back in the background
+
+    Releasing runs the connection reset query, which costs a full round-trip
+    on a remote database. The caller gets its result without waiting for it.
+
+    Usage:
+        async with acquire_release_later() as conn:
+            rows = await conn.fetch("SELECT * FROM users")
+    """
+    pool = get_pool()
+    conn = await pool.acquire()
+    try:
+        yield conn
+    finally:
+        task = asyncio.create_task(pool.release(conn))
+        _pending_releases.add(task)
+        task.add_done_callback(_pending_releases.discard)
+
+
 @contextmanager
 def get_connection():
     """
@@ -127,6 +184,18 @@ class Database:
         async with pool.acquire() as conn:
             return await conn.execute(query, *args)
 
+    async def executemany(self, query: str, args: list) -> None:
+        """
+        Execute a query once per parameter tuple in a single round-trip batch
+
+        Args:
+            query: SQL query
+            args: List of parameter tuples
+        """
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            await conn.executemany(query, args)
+
     async def fetch(self, query: str, *args) -> list:
         """
         Fetch multiple rows
@@ -138,8 +207,7 @@ class Database:
         Returns:
             List of records
         """
-        pool = get_pool()
-        async with pool.acquire() as conn:
+        async with acquire_release_later() as conn:
             return await conn.fetch(query, *args)
 
     async def fetchrow(self, query: str, *args) -> Optional[Dict]:
@@ -153,8 +221,7 @@ class Database:
         Returns:
             Single record or None
         """
-        pool = get_pool()
-        async with pool.acquire() as conn:
+        async with acquire_release_later() as conn:
             row = await conn.fetchrow(query, *args)
             return dict(row) if row else None
 
@@ -169,8 +236,7 @@ class Database:
         Returns:
             Single value
         """
-        pool = get_pool()
-        async with pool.acquire() as conn:
+        async with acquire_release_later() as conn:
             return await conn.fetchval(query, *args)
 
 
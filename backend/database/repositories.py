@@ -4,10 +4,14 @@ Provides clean interface for database operations
 """
 
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
+import asyncio
+import logging
 from .connection import get_db
 
+logger = logging.getLogger("velo.db")
+
 
 class TenantRepository:
     """Repository for tenant operations"""
@@ -195,10 +199,104 @@ class TaskRepository:
 
 
 class AgentActivityRepository:
-    """Repository for agent activity logging"""
+    """
+    Repository for agent activity logging
 
-    @staticmethod
+    Activity rows are buffered and written in batches by a background
+    flusher (see start_flusher) instead of one INSERT per log call.
+    """
+
+    # Flush when this many rows are buffered or this many seconds have passed
+    FLUSH_MAX_ROWS = 500
+    FLUSH_INTERVAL = 0.05
+
+    _INSERT_QUERY = """
+        INSERT INTO agent_activities (
+            project_id, task_id, agent_name, agent_division,
+            action, status, error_message, metadata, duration_ms, timestamp
+        )
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+    """
+
+    _queue: Optional[asyncio.Queue] = None
+    _flusher: Optional[asyncio.Task] = None
+
+    @classmethod
+    def start_flusher(cls):
+        """Start the background task that writes buffered activities"""
+        if cls._flusher is None:
+            cls._queue = asyncio.Queue()
+            cls._flusher = asyncio.create_task(cls._flush_loop())
+
+    @classmethod
+    async def stop_flusher(cls):
+        """Write any buffered activities and stop the flusher"""
+        if cls._flusher is None:
+            return
+        cls._queue.put_nowait(None)
+        await cls._flusher
+        cls._flusher = None
+        cls._queue = None
+
+    @classmethod
+    async def _flush_loop(cls):
+        loop = asyncio.get_running_loop()
+        queue = cls._queue
+
+        while True:
+            row = await queue.get()
+            if row is None:
+                return
+
+            batch = [row]
+            stopping = False
+            deadline = loop.time() + cls.FLUSH_INTERVAL
+            while len(batch) < cls.FLUSH_MAX_ROWS:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+
+            try:
+                await get_db().executemany(cls._INSERT_QUERY, batch)
+            except Exception as e:
+                # executemany is atomic, so one bad row (e.g. its project was
+                # deleted meanwhile) fails the batch; keep the rest
+                logger.warning(f"Batch write of {len(batch)} agent activities failed, retrying row by row: {e}")
+                await cls._write_rows(batch)
+
+            if stopping:
+                return
+
+    @classmethod
+    async def _write_rows(cls, rows: List[tuple]):
+        """Write activity rows one at a time, logging the ones that fail"""
+        db = get_db()
+        failed_projects: Dict[str, int] = {}
+        last_error = None
+
+        for row in rows:
+            try:
+                await db.execute(cls._INSERT_QUERY, *row)
+            except Exception as e:
+                project_id = str(row[0])
+                failed_projects[project_id] = failed_projects.get(project_id, 0) + 1
+                last_error = e
+
+        if failed_projects:
+            lost = ", ".join(f"{project_id} ({count})" for project_id, count in failed_projects.items())
+            logger.error(f"Dropped agent activities for projects {lost}: {last_error}")
+
+    @classmethod
     async def log(
+        cls,
         project_id: str,
         agent_name: str,
         agent_division: str,
@@ -208,43 +306,46 @@ class AgentActivityRepository:
         error_message: Optional[str] = None,
         metadata: Optional[Dict] = None,
         duration_ms: Optional[int] = None
-    ) -> Dict[str, Any]:
+    ) -> None:
         """Log agent activity"""
-        db = get_db()
-
-        query = """
-            INSERT INTO agent_activities (
-                project_id, task_id, agent_name, agent_division,
-                action, status, error_message, metadata, duration_ms
-            )
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-            RETURNING id, project_id, agent_name, action, status, timestamp
-        """
-
-        metadata_json = metadata or {}
-
-        return await db.fetchrow(
-            query,
+        row = (
             project_id, task_id, agent_name, agent_division,
-            action, status, error_message, metadata_json, duration_ms
+            action, status, error_message, metadata or {}, duration_ms,
+            datetime.now(timezone.utc)
         )
 
+        if cls._flusher is None:
+            # No flusher running (e.g. scripts): write straight through
+            await get_db().execute(cls._INSERT_QUERY, *row)
+            return
+
+        cls._queue.put_nowait(row)
+
     @staticmethod
     async def list_by_project(
         project_id: str,
-        limit: int = 100
+        limit: int = 100,
+        before: Optional[datetime] = None,
+        before_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get agent activities for a project"""
+        """
+        Get agent activities for a project, newest first
+
+        Pass the timestamp and id of the last activity already seen as
+        `before` / `before_id` to fetch the next page (keyset pagination on
+        project_id, timestamp, id; the id breaks timestamp ties).
+        """
         db = get_db()
 
         query = """
             SELECT * FROM agent_activities
             WHERE project_id = $1
-            ORDER BY timestamp DESC
-            LIMIT $2
+              AND ($2::timestamptz IS NULL OR (timestamp, id) < ($2, $3::uuid))
+            ORDER BY timestamp DESC, id DESC
+            LIMIT $4
         """
 
-        return await db.fetch(query, project_id, limit)
+        return await db.fetch(query, project_id, before, before_id, limit)
 
 
 class ArtifactRepository:
@@ -172,6 +172,7 @@ CREATE TABLE agent_activities (
 CREATE INDEX idx_agent_activities_project_id ON agent_activities(project_id);
 CREATE INDEX idx_agent_activities_agent_name ON agent_activities(agent_name);
 CREATE INDEX idx_agent_activities_timestamp ON agent_activities(timestamp DESC);
+CREATE INDEX idx_agent_activities_project_timestamp ON agent_activities(project_id, timestamp DESC, id DESC);
 
 -- Usage Logs (for billing and analytics)
 CREATE TABLE usage_logs (
@@ -7,6 +7,7 @@ import os
 import uuid
 import asyncio
 import json
+import orjson
 from datetime import datetime
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks, Depends, Header
@@ -182,10 +183,12 @@ class ConnectionManager:
 
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
+        # Encode once with orjson; text frames match what send_json produced
+        payload = orjson.dumps(message).decode()
         disconnected = []
         for connection in self.active_connections:
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except Exception as e:
                 print(f"Failed to send to connection: {e}")
                 disconnected.append(connection)
@@ -244,10 +247,10 @@ async def websocket_endpoint(websocket: WebSocket):
             # Keep connection alive and listen for messages
             data = await websocket.receive_text()
             # Echo back a ping response
-            await websocket.send_json({
+            await websocket.send_text(orjson.dumps({
                 "type": "ping",
                 "timestamp": datetime.utcnow().isoformat()
-            })
+            }).decode())
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
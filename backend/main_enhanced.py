@@ -4,14 +4,20 @@ Firebase Genkit + LangGraph powered AI Agent System
 """
 
 import os
+import re
 import uuid
+import queue
 import asyncio
+import logging
+import logging.handlers
+import orjson
+import msgspec
 from datetime import datetime
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks, Depends
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks, Depends, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
 
 # Load environment variables
 load_dotenv()
@@ -30,6 +36,42 @@ from database.repositories import (
 # Import Vertex AI
 from integrations.vertex_ai import get_vertex_client
 
+logger = logging.getLogger("velo.api")
+# Parent of velo.api, velo.db, ...; setup_logging attaches the queue handler here
+_root_logger = logging.getLogger("velo")
+
+# Log records are handed to a background thread so stdout writes never block the event loop
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging():
+    """Route the velo loggers through a QueueHandler/QueueListener pair"""
+    global _log_listener
+
+    if _log_listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    _root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _root_logger.setLevel(os.getenv("LOG_LEVEL", "INFO"))
+    _root_logger.propagate = False
+
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+
+
+def shutdown_logging():
+    """Flush pending log records and stop the listener thread"""
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+        _root_logger.handlers.clear()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Velo API",
@@ -46,74 +88,346 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Pydantic Models
-class ProjectCreateRequest(BaseModel):
+# Request models (validated by msgspec's C decoder instead of pydantic)
+class ProjectCreateRequest(msgspec.Struct):
     name: str
     description: str
 
-class TenantCreateRequest(BaseModel):
+class TenantCreateRequest(msgspec.Struct):
     company_name: str
     user_id: str
     email: str
 
+
+# Parts of a msgspec error path such as `$.items[0].name`
+_MSGSPEC_PATH_RE = re.compile(r"\.([^.\[`]+)|\[(\d+)\]")
+_MSGSPEC_MISSING_RE = re.compile(r"Object missing required field `([^`]+)`")
+
+
+def request_body_schema(model: type) -> Dict[str, Any]:
+    """
+    openapi_extra documenting a msgspec request body
+
+    Endpoints that decode the body themselves take a Request, so FastAPI
+    can't derive the schema. Only flat models are supported (nested
+    structs would reference $defs the document doesn't have).
+    """
+    _, components = msgspec.json.schema_components((model,))
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[model.__name__]}},
+        }
+    }
+
+
+def _validation_errors(body: bytes, error: msgspec.DecodeError) -> List[Dict[str, Any]]:
+    """Describe a msgspec decode error in FastAPI's 422 `detail` format"""
+    if not isinstance(error, msgspec.ValidationError):
+        return [{"type": "json_invalid", "loc": ["body"], "msg": "JSON decode error",
+                 "input": {}, "ctx": {"error": str(error)}}]
+
+    message, _, path = str(error).partition(" - at ")
+    loc: List[Any] = ["body"]
+    for key, index in _MSGSPEC_PATH_RE.findall(path):
+        loc.append(int(index) if index else key)
+
+    # The offending value; for a missing field, the object lacking it
+    value = msgspec.json.decode(body)
+    for part in loc[1:]:
+        value = value[part]
+
+    missing = _MSGSPEC_MISSING_RE.fullmatch(message)
+    if missing:
+        return [{"type": "missing", "loc": loc + [missing.group(1)], "msg": "Field required", "input": value}]
+    return [{"type": "value_error", "loc": loc, "msg": message, "input": value}]
+
+
+async def decode_request(http_request: Request, model: type):
+    """
+    Decode and validate a JSON request body into a msgspec model
+
+    Raises:
+        RequestValidationError: if the body is malformed or invalid (a 422
+            with the same `detail` shape as pydantic-validated endpoints)
+    """
+    body = await http_request.body()
+    try:
+        return msgspec.json.decode(body, type=model)
+    except msgspec.DecodeError as e:
+        # msgspec.ValidationError is a DecodeError subclass
+        raise RequestValidationError(_validation_errors(body, e), body=body)
+
+
+# Response models for hot read endpoints (encoded by msgspec, bypassing pydantic)
+class ProjectSummary(msgspec.Struct):
+    id: uuid.UUID
+    name: str
+    description: Optional[str]
+    status: str
+    created_at: str
+    updated_at: str
+
+class ProjectListResponse(msgspec.Struct):
+    projects: List[ProjectSummary]
+
+class TaskSummary(msgspec.Struct):
+    id: uuid.UUID
+    title: str
+    status: str
+    priority: str
+    assigned_agent: Optional[str]
+
+class ActivitySummary(msgspec.Struct):
+    id: uuid.UUID
+    agent_name: str
+    action: str
+    status: str
+    timestamp: str
+
+class ProjectDetailResponse(msgspec.Struct):
+    id: uuid.UUID
+    name: str
+    description: Optional[str]
+    status: str
+    created_at: str
+    updated_at: str
+    tasks: List[TaskSummary]
+    recent_activities: List[ActivitySummary]
+
+
+def msgspec_response(payload: msgspec.Struct) -> Response:
+    """Encode a response model with msgspec's C encoder"""
+    return Response(content=msgspec.json.encode(payload), media_type="application/json")
+
+
+# Backoff between attempts to restore a dropped Redis subscription (seconds)
+PUBSUB_RECONNECT_MIN_DELAY = 0.5
+PUBSUB_RECONNECT_MAX_DELAY = 30.0
+
+
 # WebSocket Connection Manager
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    """
+    Per-process WebSocket registry
+
+    When a Redis pub/sub bridge is started, broadcasts are published to a
+    shared channel and every worker fans them out to its own clients, so
+    events reach all clients regardless of which worker produced them.
+    """
+
+    def __init__(self, max_queue_size: int = 64, channel: str = "velo:events"):
+        self.active_connections: Set[WebSocket] = set()
+        self.max_queue_size = max_queue_size
+        self.channel = channel
+        # Each client gets a bounded outbox drained by its own writer task
+        self._outboxes: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        # Close handshakes for dropped clients, referenced until they finish
+        self._closers: Set[asyncio.Task] = set()
+        self._redis = None
+        self._subscriber: Optional[asyncio.Task] = None
+        # True while the channel subscription is live
+        self._subscribed = False
+
+    async def start_pubsub(self, redis_url: str):
+        """Bridge broadcasts across workers through Redis pub/sub"""
+        import redis.asyncio as aioredis
+
+        self._redis = aioredis.from_url(redis_url)
+        pubsub = self._redis.pubsub()
+        try:
+            await pubsub.subscribe(self.channel)
+            logger.info(f"✅ WebSocket broadcasts bridged via Redis channel {self.channel}")
+        except Exception as e:
+            # Keep the connection: the listener subscribes once Redis is
+            # reachable, and broadcasts stay local until then
+            logger.warning(f"⚠️  Redis unavailable at startup, retrying subscription: {e}")
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+            pubsub = None
+        self._subscriber = asyncio.create_task(self._listen(pubsub))
+
+    async def stop_pubsub(self):
+        """Stop the Redis subscriber and close the connection"""
+        if self._subscriber is not None:
+            self._subscriber.cancel()
+            await asyncio.gather(self._subscriber, return_exceptions=True)
+            self._subscriber = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def _listen(self, pubsub):
+        """
+        Fan out every message published on the channel to local clients
+
+        A dropped subscription is re-established with exponential backoff;
+        until then broadcast() also delivers to this worker's clients directly.
+        """
+        delay = PUBSUB_RECONNECT_MIN_DELAY
+        while True:
+            try:
+                if pubsub is None:
+                    pubsub = self._redis.pubsub()
+                    await pubsub.subscribe(self.channel)
+                    logger.info(f"✅ Redis channel {self.channel} resubscribed")
+                self._subscribed = True
+                delay = PUBSUB_RECONNECT_MIN_DELAY
+
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._local_fanout(message["data"].decode())
+            except Exception as e:
+                logger.warning(f"Redis subscription lost, retrying in {delay:.1f}s: {e}")
+            finally:
+                self._subscribed = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+                    pubsub = None
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, PUBSUB_RECONNECT_MAX_DELAY)
+
+    @property
+    def _listening(self) -> bool:
+        """Whether published messages currently reach this worker's clients"""
+        return self._subscribed and self._subscriber is not None and not self._subscriber.done()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
-        print(f"✅ WebSocket connected. Total connections: {len(self.active_connections)}")
+        self.active_connections.add(websocket)
+        self._outboxes[websocket] = asyncio.Queue(maxsize=self.max_queue_size)
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket))
+        logger.info(f"✅ WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-        print(f"❌ WebSocket disconnected. Total connections: {len(self.active_connections)}")
+        # discard/pop: the client may already have been dropped by broadcast()
+        self.active_connections.discard(websocket)
+        self._outboxes.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        logger.info(f"❌ WebSocket disconnected. Total connections: {len(self.active_connections)}")
+
+    async def _writer(self, websocket: WebSocket):
+        """Send queued payloads to one client; a slow socket only stalls itself"""
+        outbox = self._outboxes[websocket]
+        try:
+            while True:
+                payload = await outbox.get()
+                await websocket.send_text(payload)
+        except Exception as e:
+            logger.warning(f"Failed to send to connection: {e}")
+            self.disconnect(websocket)
 
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
-        disconnected = []
-        for connection in self.active_connections:
+        # Encode once for all clients; text frames match what send_json produced
+        payload = orjson.dumps(message)
+
+        if self._redis is not None:
             try:
-                await connection.send_json(message)
+                await self._redis.publish(self.channel, payload)
+                if self._listening:
+                    return
             except Exception as e:
-                print(f"Failed to send to connection: {e}")
-                disconnected.append(connection)
+                logger.error(f"Redis publish failed, broadcasting locally: {e}")
+
+        # No live subscription: this worker's clients won't see the
+        # published copy, so deliver to them directly
+        self._local_fanout(payload.decode())
 
-        # Remove disconnected clients
-        for conn in disconnected:
-            if conn in self.active_connections:
-                self.active_connections.remove(conn)
+    def _local_fanout(self, payload: str):
+        """Queue an encoded message for every client of this worker"""
+        overflowed = []
+        for connection, outbox in list(self._outboxes.items()):
+            try:
+                outbox.put_nowait(payload)
+            except asyncio.QueueFull:
+                overflowed.append(connection)
+
+        # Drop clients that can't keep up instead of buffering for them forever
+        for connection in overflowed:
+            logger.warning("Dropping slow WebSocket client: outgoing queue full")
+            self.disconnect(connection)
+            closer = asyncio.create_task(self._close_slow(connection))
+            self._closers.add(closer)
+            closer.add_done_callback(self._closers.discard)
+
+    async def _close_slow(self, websocket: WebSocket):
+        """Close a dropped client with 1013 (try again later)"""
+        try:
+            await websocket.close(code=1013)
+        except Exception as e:
+            # The socket is often already broken; it has been dropped either way
+            logger.debug(f"Failed to close slow WebSocket client: {e}")
 
 manager = ConnectionManager()
 
+
+async def gather_or_raise(*aws):
+    """
+    Run independent awaitables concurrently and re-raise the first failure
+
+    Every awaitable is allowed to finish before an exception propagates,
+    so a failed DB write never leaves a broadcast running unobserved.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
 # Startup and shutdown events
 @app.on_event("startup")
 async def startup():
     """Initialize database pool on startup"""
-    print("🚀 Starting Velo API...")
+    setup_logging()
+    logger.info("🚀 Starting Velo API...")
     try:
         await init_db_pool()
         db = get_db()
         await db.initialize()
-        print("✅ Database initialized")
+        AgentActivityRepository.start_flusher()
+        logger.info("✅ Database initialized")
     except Exception as e:
-        print(f"⚠️  Database initialization failed: {e}")
-        print("   Running without database (using mock data)")
+        logger.warning(f"⚠️  Database initialization failed: {e}")
+        logger.warning("   Running without database (using mock data)")
+
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        try:
+            await manager.start_pubsub(redis_url)
+        except Exception as e:
+            logger.warning(f"⚠️  Redis pub/sub unavailable, broadcasting per worker: {e}")
 
 @app.on_event("shutdown")
 async def shutdown():
     """Close database pool on shutdown"""
-    print("👋 Shutting down Velo API...")
+    logger.info("👋 Shutting down Velo API...")
     try:
+        await manager.stop_pubsub()
+        await AgentActivityRepository.stop_flusher()
         db = get_db()
         await db.close()
         await close_db_pool()
-        print("✅ Database closed")
+        logger.info("✅ Database closed")
     except Exception as e:
-        print(f"⚠️  Error during shutdown: {e}")
+        logger.error(f"⚠️  Error during shutdown: {e}")
+    finally:
+        shutdown_logging()
 
 # Planning Phase with Vertex AI
+
+# Caps in-flight Vertex AI calls across all concurrently planning projects
+VERTEX_SEMAPHORE = asyncio.Semaphore(int(os.getenv("VERTEX_CONCURRENCY", "8")))
+
 async def run_planning_phase_with_ai(
     project_id: str,
     project_name: str,
@@ -128,58 +442,65 @@ async def run_planning_phase_with_ai(
 
     try:
         # Step 1: Generate PRD using Vertex AI
-        await manager.broadcast({
-            "type": "agent_activity",
-            "project_id": project_id,
-            "agent_name": "Oracle",
-            "action": "Analyzing project requirements",
-            "status": "in_progress",
-            "timestamp": datetime.utcnow().isoformat()
-        })
-
-        await AgentActivityRepository.log(
-            project_id=project_id,
-            agent_name="Oracle",
-            agent_division="project_management",
-            action="Generating PRD",
-            status="started"
-        )
-
-        prd_content = await vertex.generate_prd(
-            project_name=project_name,
-            project_description=description,
-            user_requirements=description
+        ts = datetime.utcnow().isoformat()
+        await gather_or_raise(
+            manager.broadcast({
+                "type": "agent_activity",
+                "project_id": project_id,
+                "agent_name": "Oracle",
+                "action": "Analyzing project requirements",
+                "status": "in_progress",
+                "timestamp": ts
+            }),
+            AgentActivityRepository.log(
+                project_id=project_id,
+                agent_name="Oracle",
+                agent_division="project_management",
+                action="Generating PRD",
+                status="started"
+            )
         )
 
-        await manager.broadcast({
-            "type": "agent_activity",
-            "project_id": project_id,
-            "agent_name": "Oracle",
-            "action": "PRD generated successfully",
-            "status": "completed",
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        async with VERTEX_SEMAPHORE:
+            prd_content = await vertex.generate_prd(
+                project_name=project_name,
+                project_description=description,
+                user_requirements=description
+            )
 
-        await AgentActivityRepository.log(
-            project_id=project_id,
-            agent_name="Oracle",
-            agent_division="project_management",
-            action="Generated PRD",
-            status="completed",
-            metadata={"prd_length": len(prd_content)}
+        ts = datetime.utcnow().isoformat()
+        await gather_or_raise(
+            manager.broadcast({
+                "type": "agent_activity",
+                "project_id": project_id,
+                "agent_name": "Oracle",
+                "action": "PRD generated successfully",
+                "status": "completed",
+                "timestamp": ts
+            }),
+            AgentActivityRepository.log(
+                project_id=project_id,
+                agent_name="Oracle",
+                agent_division="project_management",
+                action="Generated PRD",
+                status="completed",
+                metadata={"prd_length": len(prd_content)}
+            )
         )
 
         # Step 2: Break down into tasks
+        ts = datetime.utcnow().isoformat()
         await manager.broadcast({
             "type": "agent_activity",
             "project_id": project_id,
             "agent_name": "Neuron",
             "action": "Breaking down PRD into tasks",
             "status": "in_progress",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": ts
         })
 
-        tasks = await vertex.generate_task_breakdown(prd_content, project_name)
+        async with VERTEX_SEMAPHORE:
+            tasks = await vertex.generate_task_breakdown(prd_content, project_name)
 
         # Step 3: Create tasks in database
         for task_data in tasks:
@@ -192,29 +513,31 @@ async def run_planning_phase_with_ai(
                 status="pending"
             )
 
+        # The "tasks created" and "project ready" messages share one timestamp
+        ts = datetime.utcnow().isoformat()
         await manager.broadcast({
             "type": "agent_activity",
             "project_id": project_id,
             "agent_name": "Neuron",
             "action": f"Created {len(tasks)} tasks",
             "status": "completed",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": ts
         })
 
-        # Step 4: Update project status
-        await ProjectRepository.update_status(project_id, "in_progress")
-
-        # Final broadcast
-        await manager.broadcast({
-            "type": "project_status",
-            "project_id": project_id,
-            "status": "ready",
-            "message": f"Project '{project_name}' is ready! Planning phase completed with {len(tasks)} tasks.",
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        # Step 4: Update project status and send final broadcast
+        await gather_or_raise(
+            ProjectRepository.update_status(project_id, "in_progress"),
+            manager.broadcast({
+                "type": "project_status",
+                "project_id": project_id,
+                "status": "ready",
+                "message": f"Project '{project_name}' is ready! Planning phase completed with {len(tasks)} tasks.",
+                "timestamp": ts
+            })
+        )
 
     except Exception as e:
-        print(f"Error in planning phase: {e}")
+        logger.error(f"Error in planning phase: {e}")
         await manager.broadcast({
             "type": "project_status",
             "project_id": project_id,
@@ -234,24 +557,30 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             data = await websocket.receive_text()
-            await websocket.send_json({
+            await websocket.send_text(orjson.dumps({
                 "type": "ping",
                 "timestamp": datetime.utcnow().isoformat()
-            })
+            }).decode())
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
-        print(f"WebSocket error: {e}")
+        logger.error(f"WebSocket error: {e}")
         manager.disconnect(websocket)
 
 
 # Tenant endpoints
-@app.post("/api/tenant/create")
-async def create_tenant(request: TenantCreateRequest):
+
+# Spaces/underscores -> dashes, applied after lower() (which also covers
+# non-ASCII capitals)
+_SUBDOMAIN_TABLE = str.maketrans({" ": "-", "_": "-"})
+
+@app.post("/api/tenant/create", openapi_extra=request_body_schema(TenantCreateRequest))
+async def create_tenant(http_request: Request):
     """Create a new tenant account"""
+    request = await decode_request(http_request, TenantCreateRequest)
     try:
         # Generate subdomain from company name
-        subdomain = request.company_name.lower().replace(" ", "-").replace("_", "-")
+        subdomain = request.company_name.lower().translate(_SUBDOMAIN_TABLE)
 
         # Create tenant
         tenant = await TenantRepository.create(
@@ -279,14 +608,15 @@ async def create_tenant(request: TenantCreateRequest):
         }
 
     except Exception as e:
-        print(f"Error creating tenant: {e}")
+        logger.error(f"Error creating tenant: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # Project endpoints
-@app.post("/api/project/create")
-async def create_project(request: ProjectCreateRequest, background_tasks: BackgroundTasks):
+@app.post("/api/project/create", openapi_extra=request_body_schema(ProjectCreateRequest))
+async def create_project(http_request: Request, background_tasks: BackgroundTasks):
     """Create a new project and initiate the Planning Phase"""
+    request = await decode_request(http_request, ProjectCreateRequest)
     try:
         # TODO: Get tenant_id and user_id from JWT token
         # For now, using mock values
@@ -333,7 +663,7 @@ async def create_project(request: ProjectCreateRequest, background_tasks: Backgr
         }
 
     except Exception as e:
-        print(f"Error creating project: {e}")
+        logger.error(f"Error creating project: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -346,28 +676,36 @@ async def list_projects(tenant_id: Optional[str] = None):
 
         projects = await ProjectRepository.list_by_tenant(tenant_id)
 
-        return {
-            "projects": [
-                {
-                    "id": p["id"],
-                    "name": p["name"],
-                    "description": p["description"],
-                    "status": p["status"],
-                    "created_at": p["created_at"].isoformat(),
-                    "updated_at": p["updated_at"].isoformat()
-                }
-                for p in projects
-            ]
-        }
+        return msgspec_response(ProjectListResponse(projects=[
+            ProjectSummary(
+                id=p["id"],
+                name=p["name"],
+                description=p["description"],
+                status=p["status"],
+                created_at=p["created_at"].isoformat(),
+                updated_at=p["updated_at"].isoformat()
+            )
+            for p in projects
+        ]))
 
     except Exception as e:
-        print(f"Error listing projects: {e}")
-        return {"projects": []}
+        logger.error(f"Error listing projects: {e}")
+        return msgspec_response(ProjectListResponse(projects=[]))
 
 
 @app.get("/api/project/{project_id}")
-async def get_project(project_id: str):
-    """Get project details"""
+async def get_project(
+    project_id: str,
+    activities_before: Optional[datetime] = None,
+    activities_before_id: Optional[uuid.UUID] = None
+):
+    """
+    Get project details
+
+    `activities_before` / `activities_before_id` page through older
+    activities: pass the timestamp and id of the oldest activity from the
+    previous response.
+    """
     try:
         project = await ProjectRepository.get_by_id(project_id)
 
@@ -378,40 +716,46 @@ async def get_project(project_id: str):
         tasks = await TaskRepository.list_by_project(project_id)
 
         # Get agent activities
-        activities = await AgentActivityRepository.list_by_project(project_id, limit=50)
+        activities = await AgentActivityRepository.list_by_project(
+            project_id,
+            limit=50,
+            before=activities_before,
+            before_id=activities_before_id
+        )
 
-        return {
-            "id": project["id"],
-            "name": project["name"],
-            "description": project["description"],
-            "status": project["status"],
-            "created_at": project["created_at"].isoformat(),
-            "updated_at": project["updated_at"].isoformat(),
-            "tasks": [
-                {
-                    "id": t["id"],
-                    "title": t["title"],
-                    "status": t["status"],
-                    "priority": t["priority"],
-                    "assigned_agent": t["assigned_agent"]
-                }
+        return msgspec_response(ProjectDetailResponse(
+            id=project["id"],
+            name=project["name"],
+            description=project["description"],
+            status=project["status"],
+            created_at=project["created_at"].isoformat(),
+            updated_at=project["updated_at"].isoformat(),
+            tasks=[
+                TaskSummary(
+                    id=t["id"],
+                    title=t["title"],
+                    status=t["status"],
+                    priority=t["priority"],
+                    assigned_agent=t["assigned_agent"]
+                )
                 for t in tasks
             ],
-            "recent_activities": [
-                {
-                    "agent_name": a["agent_name"],
-                    "action": a["action"],
-                    "status": a["status"],
-                    "timestamp": a["timestamp"].isoformat()
-                }
+            recent_activities=[
+                ActivitySummary(
+                    id=a["id"],
+                    agent_name=a["agent_name"],
+                    action=a["action"],
+                    status=a["status"],
+                    timestamp=a["timestamp"].isoformat()
+                )
                 for a in activities
             ]
-        }
+        ))
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error getting project: {e}")
+        logger.error(f"Error getting project: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -436,4 +780,14 @@ if __name__ == "__main__":
     print(f"🤖 Vertex AI Integration: Enabled")
     print(f"💾 Database Integration: Enabled")
 
-    uvicorn.run("main_enhanced:app", host=host, port=port, reload=True)
+    reload = os.getenv("API_RELOAD", "false").lower() == "true"
+
+    uvicorn.run(
+        "main_enhanced:app",
+        host=host,
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        reload=reload
+    )
@@ -12,6 +12,40 @@ import sys
 from database.firestore_db import get_db
 from datetime import datetime
 
+# Firestore allows at most 500 writes per batch
+BATCH_SIZE = 500
+
+
+def commit_in_batches(db, collection: str, updates: list) -> int:
+    """
+    Apply (doc_id, fields) updates using batched writes
+
+    Args:
+        db: Firestore database wrapper
+        collection: Collection name
+        updates: List of (document_id, fields) tuples
+
+    Returns:
+        Number of documents updated
+    """
+    updated = 0
+
+    for start in range(0, len(updates), BATCH_SIZE):
+        chunk = updates[start:start + BATCH_SIZE]
+        batch = db.db.batch()
+        for doc_id, fields in chunk:
+            batch.update(db.db.collection(collection).document(doc_id), fields)
+
+        try:
+            batch.commit()
+            updated += len(chunk)
+            print(f"  ✓ Committed batch of {len(chunk)} {collection}")
+        except Exception as e:
+            print(f"  ✗ Failed to update batch of {len(chunk)} {collection}: {e}")
+
+    return updated
+
+
 def migrate_to_multi_tenant():
     """Migrate existing data to multi-tenant structure"""
 
@@ -59,27 +93,23 @@ def migrate_to_multi_tenant():
     # Get all projects (without tenant filter)
     all_projects = db.list_projects(tenant_id=None, limit=1000)
 
-    projects_updated = 0
     projects_skipped = 0
+    project_updates = []
+    now = datetime.utcnow().isoformat()
 
     for project in all_projects:
-        project_id = project['id']
-
         # Check if project already has tenant_id
         if project.get('tenant_id'):
             projects_skipped += 1
             continue
 
-        # Update project with tenant_id
-        try:
-            db.update_project(project_id, {
-                'tenant_id': tenant_id,
-                'migrated_at': datetime.utcnow().isoformat()
-            })
-            projects_updated += 1
-            print(f"  ✓ Updated project: {project.get('name', 'Unnamed')} (ID: {project_id})")
-        except Exception as e:
-            print(f"  ✗ Failed to update project {project_id}: {e}")
+        project_updates.append((project['id'], {
+            'tenant_id': tenant_id,
+            'migrated_at': now,
+            'updated_at': now
+        }))
+
+    projects_updated = commit_in_batches(db, 'projects', project_updates)
 
     print(f"\n✅ Projects migration complete:")
     print(f"   - Updated: {projects_updated}")
@@ -91,29 +121,25 @@ def migrate_to_multi_tenant():
 
     # Get all users from Firestore
     users_collection = db.db.collection('users').stream()
-    users_updated = 0
     users_skipped = 0
+    user_updates = []
 
     for user_doc in users_collection:
         user_data = user_doc.to_dict()
-        user_id = user_doc.id
 
         # Check if user already has tenant_id
         if user_data.get('tenant_id'):
             users_skipped += 1
             continue
 
-        # Update user with tenant_id
-        try:
-            db.update_user(user_id, {
-                'tenant_id': tenant_id,
-                'role': 'admin',  # Make all existing users admins
-                'migrated_at': datetime.utcnow().isoformat()
-            })
-            users_updated += 1
-            print(f"  ✓ Updated user: {user_data.get('email', 'Unknown')} (ID: {user_id})")
-        except Exception as e:
-            print(f"  ✗ Failed to update user {user_id}: {e}")
+        user_updates.append((user_doc.id, {
+            'tenant_id': tenant_id,
+            'role': 'admin',  # Make all existing users admins
+            'migrated_at': now,
+            'updated_at': now
+        }))
+
+    users_updated = commit_in_batches(db, 'users', user_updates)
 
     print(f"\n✅ User profiles migration complete:")
     print(f"   - Updated: {users_updated}")
@@ -4,6 +4,8 @@ This creates Python files for all 51 agents based on the template
 """
 
 import os
+import string
+from concurrent.futures import ThreadPoolExecutor
 
 # All 51 agents with their metadata
 AGENTS = [
@@ -130,6 +132,19 @@ from ..base_agent import agent_registry
 agent_registry.register({class_name}Agent())
 '''
 
+# Parse the template once: (literal_text, field_name) pairs, field_name is None at the end
+TEMPLATE_PARTS = [
+    (literal, field_name)
+    for literal, field_name, _, _ in string.Formatter().parse(AGENT_TEMPLATE)
+]
+
+def render_template(**values):
+    """Fill AGENT_TEMPLATE from the pre-parsed parts (same output as .format)"""
+    return "".join(
+        literal + (str(values[field_name]) if field_name is not None else "")
+        for literal, field_name in TEMPLATE_PARTS
+    )
+
 def generate_agent_file(agent_data):
     """Generate a Python file for an agent"""
     agent_id, name, role, tagline, division, capabilities = agent_data
@@ -142,7 +157,7 @@ def generate_agent_file(agent_data):
     os.makedirs(division_dir, exist_ok=True)
 
     # Generate content
-    content = AGENT_TEMPLATE.format(
+    content = render_template(
         name=name,
         tagline=tagline,
         role=role,
@@ -167,15 +182,20 @@ def generate_agent_file(agent_data):
 
     print(f"✓ Generated {filepath}")
 
+def _generate_safely(agent_data):
+    """Generate one agent file, reporting errors instead of raising"""
+    try:
+        generate_agent_file(agent_data)
+    except Exception as e:
+        print(f"✗ Error generating {agent_data[1]}: {e}")
+
 def main():
     """Generate all agent files"""
     print("Generating all 51 AI agents...")
 
-    for agent_data in AGENTS:
-        try:
-            generate_agent_file(agent_data)
-        except Exception as e:
-            print(f"✗ Error generating {agent_data[1]}: {e}")
+    # File writes are independent and I/O-bound, so overlap them
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_generate_safely, AGENTS))
 
     print(f"\n✓ Generated {len(AGENTS)} agent files successfully!")
 
@@ -0,0 +1,209 @@
+"""
+Tests for the WebSocket ConnectionManager's Redis pub/sub bridge and for
+msgspec request body decoding
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("dotenv")
+pytest.importorskip("asyncpg")
+
+import main_enhanced
+from fastapi.testclient import TestClient
+from main_enhanced import ConnectionManager, app
+
+
+class FakePubSub:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel: str):
+        if self.redis.down:
+            raise ConnectionError("Redis unavailable")
+        self.redis.subscribers.append(self)
+
+    async def listen(self):
+        while True:
+            message = await self.messages.get()
+            if message is None:
+                raise ConnectionError("Connection reset by peer")
+            yield message
+
+    def drop(self):
+        self.messages.put_nowait(None)
+
+    async def aclose(self):
+        if self in self.redis.subscribers:
+            self.redis.subscribers.remove(self)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.subscribers = []
+        self.published = []
+        self.down = False
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self)
+
+    async def publish(self, channel: str, payload: bytes):
+        self.published.append(payload)
+        for subscriber in list(self.subscribers):
+            subscriber.messages.put_nowait({"type": "message", "data": payload})
+
+    async def aclose(self):
+        pass
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _bridged_manager(redis: FakeRedis):
+    """A manager wired to a fake Redis that records what reaches local clients"""
+    manager = ConnectionManager()
+    delivered = []
+    manager._local_fanout = delivered.append
+    manager._redis = redis
+    return manager, delivered
+
+
+def test_broadcast_goes_through_redis_while_subscribed():
+    async def run():
+        redis = FakeRedis()
+        manager, delivered = _bridged_manager(redis)
+
+        pubsub = redis.pubsub()
+        await pubsub.subscribe(manager.channel)
+        manager._subscriber = asyncio.create_task(manager._listen(pubsub))
+        await _settle()
+
+        await manager.broadcast({"n": 1})
+        await _settle()
+        await manager.stop_pubsub()
+
+        # Delivered once, via the subscription
+        assert delivered == ['{"n":1}']
+        assert redis.published == [b'{"n":1}']
+
+    asyncio.run(run())
+
+
+def test_broadcast_falls_back_locally_until_resubscribed(monkeypatch):
+    monkeypatch.setattr(main_enhanced, "PUBSUB_RECONNECT_MIN_DELAY", 0.01)
+
+    async def run():
+        redis = FakeRedis()
+        manager, delivered = _bridged_manager(redis)
+
+        pubsub = redis.pubsub()
+        await pubsub.subscribe(manager.channel)
+        manager._subscriber = asyncio.create_task(manager._listen(pubsub))
+        await _settle()
+
+        # Subscription drops and Redis refuses to resubscribe for now
+        redis.down = True
+        pubsub.drop()
+        await _settle()
+
+        await manager.broadcast({"n": 2})
+        assert delivered == ['{"n":2}']
+        assert redis.published == [b'{"n":2}']
+
+        # Once Redis is back the listener resubscribes and the bridge resumes
+        redis.down = False
+        for _ in range(100):
+            if redis.subscribers:
+                break
+            await asyncio.sleep(0.01)
+        await _settle()
+
+        await manager.broadcast({"n": 3})
+        await _settle()
+        await manager.stop_pubsub()
+
+        assert delivered == ['{"n":2}', '{"n":3}']
+
+    asyncio.run(run())
+
+
+def test_listener_subscribes_once_redis_is_reachable(monkeypatch):
+    monkeypatch.setattr(main_enhanced, "PUBSUB_RECONNECT_MIN_DELAY", 0.01)
+
+    async def run():
+        # Redis down at startup: start_pubsub hands the listener no subscription
+        redis = FakeRedis()
+        redis.down = True
+        manager, delivered = _bridged_manager(redis)
+        manager._subscriber = asyncio.create_task(manager._listen(None))
+        await _settle()
+
+        await manager.broadcast({"n": 5})
+        assert delivered == ['{"n":5}']
+
+        redis.down = False
+        for _ in range(100):
+            if redis.subscribers:
+                break
+            await asyncio.sleep(0.01)
+        await _settle()
+
+        await manager.broadcast({"n": 6})
+        await _settle()
+        await manager.stop_pubsub()
+
+        assert delivered == ['{"n":5}', '{"n":6}']
+
+    asyncio.run(run())
+
+
+def test_broadcast_falls_back_locally_when_listener_has_stopped():
+    async def run():
+        redis = FakeRedis()
+        manager, delivered = _bridged_manager(redis)
+
+        manager._subscriber = asyncio.create_task(asyncio.sleep(0))
+        await manager._subscriber
+
+        await manager.broadcast({"n": 4})
+        await manager.stop_pubsub()
+
+        assert delivered == ['{"n":4}']
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("body, error", [
+    (b'{"company_name": 1, "user_id": "u", "email": "e"}',
+     {"type": "value_error", "loc": ["body", "company_name"], "msg": "Expected `str`, got `int`", "input": 1}),
+    (b'{"company_name": "Acme"}',
+     {"type": "missing", "loc": ["body", "user_id"], "msg": "Field required", "input": {"company_name": "Acme"}}),
+])
+def test_invalid_body_gets_fastapi_validation_detail(body, error):
+    # Rejected while decoding, before the endpoint touches the database
+    response = TestClient(app).post("/api/tenant/create", content=body)
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": [error]}
+
+
+def test_malformed_body_is_reported_as_json_invalid():
+    response = TestClient(app).post("/api/project/create", content=b"{bad")
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert (error["type"], error["loc"]) == ("json_invalid", ["body"])
+
+
+def test_request_bodies_are_documented():
+    paths = app.openapi()["paths"]
+
+    tenant = paths["/api/tenant/create"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+    project = paths["/api/project/create"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+    assert tenant["required"] == ["company_name", "user_id", "email"]
+    assert project["required"] == ["name", "description"]
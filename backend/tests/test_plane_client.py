@@ -0,0 +1,125 @@
+"""
+Tests for PlaneClient workspace setup, bulk issue creation and the GET cache
+"""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+orjson = pytest.importorskip("orjson")
+
+from tools.plane_client import PlaneClient
+
+
+TENANT_ID = "3f2a9c1e-7b4d-4e8a-9f1c-2d5e6a7b8c9d"
+
+
+def _setup_workspace(company_name: str) -> dict:
+    """Run setup_velo_workspace against a stubbed create_workspace"""
+    async def run():
+        client = PlaneClient(api_url="http://plane.test", api_key="test-key")
+
+        async def create_workspace(name, slug, tenant_id):
+            return {"id": "ws-1", "name": name, "slug": slug}
+
+        client.create_workspace = create_workspace
+        try:
+            return await client.setup_velo_workspace(TENANT_ID, company_name)
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("company_name, slug", [
+    ("Acme Corp", "acme-corp"),
+    ("Acme, Inc.", "acme-inc"),
+    ("Café Co", "cafe-co"),
+    ("Ｖｅｌｏ Ｌａｂｓ", "velo-labs"),
+    ("O'Reilly Media", "o-reilly-media"),
+    ("  big_data   labs  ", "big-data-labs"),
+    ("R&D -- Studio", "r-d-studio"),
+])
+def test_workspace_slug_normalisation(company_name, slug):
+    workspace = _setup_workspace(company_name)
+
+    assert workspace["workspace_slug"] == slug
+    assert workspace["name"] == f"{company_name} - Velo"
+
+
+@pytest.mark.parametrize("company_name", ["", "!!!", "  ", "日本"])
+def test_workspace_slug_falls_back_to_tenant_id(company_name):
+    workspace = _setup_workspace(company_name)
+
+    assert workspace["workspace_slug"] == "velo-3f2a9c1e"
+
+
+def _bulk_create(bulk_status: int, bulk_issues=None, calls: int = 1):
+    """Run bulk_create_issues `calls` times against a fake Plane; returns (results, paths, client)"""
+    paths = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/bulk/"):
+            return httpx.Response(bulk_status, content=orjson.dumps({"issues": bulk_issues or []}))
+        return httpx.Response(201, content=orjson.dumps({"id": f"issue-{len(paths)}"}))
+
+    async def run():
+        client = PlaneClient(api_url="http://plane.test", api_key="test-key")
+        await client.client.aclose()
+        client.client = httpx.AsyncClient(base_url="http://plane.test", transport=httpx.MockTransport(handle))
+        try:
+            issues = [{"title": "a"}, {"title": "b"}]
+            return [await client.bulk_create_issues("acme", "p1", issues) for _ in range(calls)], client
+        finally:
+            await client.close()
+
+    results, client = asyncio.run(run())
+    return results, paths, client
+
+
+def test_bulk_create_falls_back_without_caching_a_404():
+    results, paths, client = _bulk_create(404, calls=2)
+
+    assert [len(created) for created in results] == [2, 2]
+    # A missing project isn't a missing endpoint: the second call probes again
+    assert sum(path.endswith("/bulk/") for path in paths) == 2
+    assert client._supports_bulk_issues is None
+
+
+def test_bulk_create_remembers_an_unsupported_endpoint():
+    results, paths, client = _bulk_create(405, calls=2)
+
+    assert [len(created) for created in results] == [2, 2]
+    assert sum(path.endswith("/bulk/") for path in paths) == 1
+    assert client._supports_bulk_issues is False
+
+
+def test_bulk_create_rejects_a_short_response():
+    with pytest.raises(ValueError, match="1 issues for 2 sent"):
+        _bulk_create(201, bulk_issues=[{"id": "issue-1"}])
+
+
+def test_cached_reads_return_independent_copies():
+    requests = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=orjson.dumps({"id": "p1", "members": ["u1"]}))
+
+    async def run():
+        client = PlaneClient(api_url="http://plane.test", api_key="test-key")
+        await client.client.aclose()
+        client.client = httpx.AsyncClient(base_url="http://plane.test", transport=httpx.MockTransport(handle))
+        try:
+            first = await client.get_project("acme", "p1")
+            first["members"].append("u2")
+            return await client.get_project("acme", "p1")
+        finally:
+            await client.close()
+
+    second = asyncio.run(run())
+
+    assert len(requests) == 1
+    assert second == {"id": "p1", "members": ["u1"]}
@@ -0,0 +1,59 @@
+"""
+Tests for repository behaviour that doesn't need a live database
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+from database import repositories
+from database.repositories import AgentActivityRepository
+
+
+class FakeDB:
+    """Records inserted rows; rows for projects in `missing` violate the FK"""
+
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.rows = []
+
+    async def executemany(self, query, args):
+        if any(row[0] in self.missing for row in args):
+            raise ValueError("insert violates foreign key constraint")
+        self.rows.extend(args)
+
+    async def execute(self, query, *row):
+        if row[0] in self.missing:
+            raise ValueError("insert violates foreign key constraint")
+        self.rows.append(row)
+
+
+def _log_activities(monkeypatch, db, project_ids):
+    monkeypatch.setattr(repositories, "get_db", lambda: db)
+
+    async def run():
+        AgentActivityRepository.start_flusher()
+        for number, project_id in enumerate(project_ids):
+            await AgentActivityRepository.log(project_id, "Nova", "engineering", f"step {number}", "completed")
+        await AgentActivityRepository.stop_flusher()
+
+    asyncio.run(run())
+
+
+def test_activities_are_written_in_one_batch(monkeypatch):
+    db = FakeDB()
+
+    _log_activities(monkeypatch, db, ["p1", "p2", "p1"])
+
+    assert [row[4] for row in db.rows] == ["step 0", "step 1", "step 2"]
+
+
+def test_failed_batch_keeps_the_valid_rows(monkeypatch, caplog):
+    db = FakeDB(missing={"deleted-project"})
+
+    _log_activities(monkeypatch, db, ["p1", "deleted-project", "p2"])
+
+    assert [row[0] for row in db.rows] == ["p1", "p2"]
+    assert "deleted-project (1)" in caplog.text
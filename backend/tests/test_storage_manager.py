@@ -0,0 +1,104 @@
+"""
+Tests for StorageManager project exports
+"""
+
+import io
+import random
+import zipfile
+import zlib
+
+import pytest
+
+pytest.importorskip("google.cloud.storage")
+
+from tools import storage_manager
+from tools.storage_manager import StorageManager
+
+
+class FakeBlob:
+    def __init__(self, name: str, content: bytes = b""):
+        self.name = name
+        self.content = content
+        self.content_type = None
+
+    def download_as_bytes(self):
+        return self.content
+
+
+class FakeBucket:
+    def blob(self, path: str) -> FakeBlob:
+        return FakeBlob(path)
+
+
+def _sample_text(seed: int, words: int = 20000) -> bytes:
+    """Repetitive but not trivial text, where DEFLATE levels 3 and 6 differ"""
+    rng = random.Random(seed)
+    vocabulary = ["const", "return", "function", "await", "import", "export", "value", "props", "state", "=>"]
+    return " ".join(rng.choice(vocabulary) + str(rng.randrange(100)) for _ in range(words)).encode()
+
+
+def _raw_deflate_size(data: bytes, level: int) -> int:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return len(compressor.compress(data) + compressor.flush())
+
+
+def _export(artifacts: dict) -> zipfile.ZipFile:
+    """Run create_project_export over in-memory artifacts and open the result"""
+    manager = object.__new__(StorageManager)
+    manager.bucket = FakeBucket()
+    manager._gs_prefix = "gs://test-bucket/"
+    manager.iter_project_artifact_blobs = lambda tenant_id, project_id: iter([
+        FakeBlob(f"{tenant_id}/{project_id}/artifacts/{name}", content)
+        for name, content in artifacts.items()
+    ])
+
+    uploaded = {}
+    manager._upload_spool = lambda blob, spool: uploaded.update(path=blob.name, data=spool.read())
+
+    gcs_path = manager.create_project_export("tenant", "project", "demo")
+
+    assert gcs_path == "gs://test-bucket/" + uploaded["path"]
+    return zipfile.ZipFile(io.BytesIO(uploaded["data"]))
+
+
+def test_export_compresses_artifacts_at_export_level():
+    source = _sample_text(1)
+    level = storage_manager.EXPORT_COMPRESS_LEVEL
+    assert _raw_deflate_size(source, level) != _raw_deflate_size(source, 6)
+
+    info = _export({"app.ts": source}).getinfo("03_Source_Code/app.ts")
+
+    assert info.compress_type == zipfile.ZIP_DEFLATED
+    assert info.compress_size == _raw_deflate_size(source, level)
+
+
+def test_export_stores_compressed_formats_and_files_by_folder():
+    artifacts = {
+        "prd_v1.md": b"# PRD",
+        "architecture.png": b"\x89PNG" + bytes(range(256)) * 8,
+        "server.py": b"print('hi')\n",
+        "qa_report.md": b"# QA",
+        "user_guide.md": b"# Guide",
+    }
+
+    archive = _export(artifacts)
+
+    assert sorted(archive.namelist()) == [
+        "01_Strategy/prd_v1.md",
+        "02_Architecture/architecture.png",
+        "03_Source_Code/server.py",
+        "04_Quality_Assurance/qa_report.md",
+        "05_Manuals/user_guide.md",
+        "README.md",
+    ]
+    assert archive.getinfo("02_Architecture/architecture.png").compress_type == zipfile.ZIP_STORED
+    assert archive.read("03_Source_Code/server.py") == artifacts["server.py"]
+
+
+def test_export_handles_more_artifacts_than_the_download_window():
+    artifacts = {f"module_{i}.py": _sample_text(i, words=50) for i in range(storage_manager.EXPORT_MAX_IN_FLIGHT * 3)}
+
+    archive = _export(artifacts)
+
+    for name, content in artifacts.items():
+        assert archive.read(f"03_Source_Code/{name}") == content
@@ -0,0 +1,199 @@
+"""
+Tests for VertexAIClient response handling, with the model RPC stubbed out
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("vertexai")
+pytest.importorskip("jiter")
+pytest.importorskip("diskcache")
+
+from tools import vertex_ai_client
+from tools.vertex_ai_client import VertexAIClient, _extract_json
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+
+class TruncatedResponse(FakeResponse):
+    class candidate:
+        finish_reason = vertex_ai_client.FinishReason.MAX_TOKENS
+
+    candidates = [candidate]
+
+
+class BlockedResponse:
+    @property
+    def text(self) -> str:
+        # What the SDK raises for a safety-blocked or empty candidate
+        raise ValueError("Response candidate content has no parts (blocked: SAFETY)")
+
+
+@pytest.fixture
+def run_client(tmp_path, monkeypatch):
+    """Run a coroutine function against a client whose RPCs return the given responses"""
+    monkeypatch.setenv("VERTEX_CACHE_DIR", str(tmp_path / "vertex_cache"))
+    # No credentials here; the RPC itself is stubbed below
+    monkeypatch.setattr(VertexAIClient, "_prediction_client", None)
+
+    def run(func, respond):
+        calls = []
+
+        async def generate_content_async(model, prompt, generation_config=None, stream=False):
+            calls.append(prompt)
+            return await respond(stream)
+
+        monkeypatch.setattr(vertex_ai_client.GenerativeModel, "generate_content_async", generate_content_async)
+
+        async def main():
+            client = VertexAIClient(project_id="test-project", location="us-central1")
+            try:
+                return await func(client)
+            finally:
+                await client.close()
+
+        return asyncio.run(main()), calls
+
+    return run
+
+
+def _returning(response):
+    async def respond(stream):
+        if stream:
+            async def chunks():
+                yield response
+            return chunks()
+        return response
+    return respond
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_validate_code_raises_on_blocked_response(run_client, stream):
+    with pytest.raises(ValueError, match="blocked"):
+        run_client(
+            lambda client: client.validate_code("x = 1", "python", "Set x", "QA", stream=stream),
+            _returning(BlockedResponse())
+        )
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_task_breakdown_raises_on_blocked_response(run_client, stream):
+    with pytest.raises(ValueError, match="blocked"):
+        run_client(
+            lambda client: client.analyze_and_break_down_tasks("# PRD", "Planner", stream=stream),
+            _returning(BlockedResponse())
+        )
+
+
+def test_validate_code_falls_back_on_unparseable_json(run_client):
+    result, _ = run_client(
+        lambda client: client.validate_code("x = 1", "python", "Set x", "QA"),
+        _returning(FakeResponse("I can't produce JSON for this"))
+    )
+
+    assert result == {"passed": True, "issues": [], "suggestions": [], "score": 85}
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("text", [
+    '{"pas',
+    '```json\n{"passed": false, "issues": [{"severity": "high"}',
+    '["not", "a", "result"]',
+])
+def test_validate_code_falls_back_on_truncated_json(run_client, stream, text):
+    result, _ = run_client(
+        lambda client: client.validate_code("x = 1", "python", "Set x", "QA", stream=stream),
+        _returning(FakeResponse(text))
+    )
+
+    assert result == {"passed": True, "issues": [], "suggestions": [], "score": 85}
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_task_breakdown_falls_back_when_no_task_is_complete(run_client, stream):
+    tasks, _ = run_client(
+        lambda client: client.analyze_and_break_down_tasks("# PRD", "Planner", stream=stream),
+        _returning(FakeResponse('[{"title": "a'))
+    )
+
+    assert [task["title"] for task in tasks] == ["Parse PRD and create detailed tasks"]
+
+
+def test_validate_code_parses_fenced_json(run_client):
+    result, _ = run_client(
+        lambda client: client.validate_code("x = 1", "python", "Set x", "QA", stream=True),
+        _returning(FakeResponse('Review:\n```json\n{"passed": false, "score": 40}\n```\nDone.'))
+    )
+
+    assert result == {"passed": False, "score": 40}
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_truncated_response_is_logged(run_client, caplog, stream):
+    async def func(client):
+        if stream:
+            return "".join([text async for text in client.generate_content_stream("prompt")])
+        return await client.generate_content("prompt")
+
+    text, _ = run_client(func, _returning(TruncatedResponse("cut o")))
+
+    assert text == "cut o"
+    assert "truncated at max_output_tokens" in caplog.text
+
+
+def test_identical_requests_share_one_call(run_client):
+    async def respond(stream):
+        await asyncio.sleep(0.01)
+        return FakeResponse("shared")
+
+    async def func(client):
+        return await asyncio.gather(*(
+            client.generate_content("same prompt", temperature=0.9) for _ in range(5)
+        ))
+
+    results, calls = run_client(func, respond)
+
+    assert results == ["shared"] * 5
+    assert len(calls) == 1
+
+
+def test_lone_request_skips_the_batch_window(run_client):
+    async def func(client):
+        client.batch_window = 5.0
+        return await asyncio.wait_for(client.generate_content("alone"), timeout=1.0)
+
+    text, _ = run_client(func, _returning(FakeResponse("done")))
+
+    assert text == "done"
+
+
+def test_models_share_one_prediction_client(tmp_path, monkeypatch):
+    monkeypatch.setenv("VERTEX_CACHE_DIR", str(tmp_path / "vertex_cache"))
+    shared = object()
+    monkeypatch.setattr(VertexAIClient, "_prediction_client", shared)
+
+    client = VertexAIClient(project_id="test-project", location="us-central1")
+    models = [client.model, client.model_flash, client._get_model("You are Nova")]
+
+    assert all(model._prediction_async_client is shared for model in models)
+    asyncio.run(client.close())
+
+
+def test_extract_json_keeps_only_complete_items():
+    truncated = '```json\n[{"title": "a", "deps": ["x"]}, {"title": "b", "desc'
+
+    assert _extract_json(truncated) == [{"title": "a", "deps": ["x"]}]
+    with pytest.raises(ValueError):
+        _extract_json(truncated, partial=False)
+
+
+def test_extract_json_ignores_trailing_prose():
+    assert _extract_json("Here you go: [1, 2] (that is all)") == [1, 2]
@@ -5,9 +5,26 @@ Handles workspace, project, and issue management
 """
 
 import os
+import re
+import time
+import random
+import asyncio
+import unicodedata
 import httpx
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import orjson
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime, timezone
+
+# Workspace slugs: every run of characters other than [a-z0-9] becomes one dash
+_SLUG_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+# Retry classification for PlaneClient._request
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"}
+_RETRY_STATUSES = {502, 503, 504}
+# The request never (fully) reached the server, so resending is always safe
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout, httpx.WriteError)
+# The server may have received the request before the connection dropped
+_STALE_CONNECTION_ERRORS = (httpx.RemoteProtocolError, httpx.ReadError)
 
 
 class PlaneClient:
@@ -19,7 +36,13 @@ class PlaneClient:
     def __init__(
         self,
         api_url: Optional[str] = None,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        concurrency: int = 16,
+        max_connections: int = 64,
+        keepalive_expiry: float = 30.0,
+        cache_ttl: float = 5.0,
+        max_attempts: int = 3,
+        retry_backoff: float = 0.1
     ):
         self.api_url = api_url or os.getenv("PLANE_API_URL", "http://localhost:8001")
         self.api_key = api_key or os.getenv("PLANE_API_KEY")
@@ -32,16 +55,103 @@ class PlaneClient:
             "Content-Type": "application/json"
         }
 
+        # Keep warmed connections around between bursts of calls; keepalive_expiry
+        # should stay a little below the server's idle timeout so we never reuse
+        # a socket the server is about to close
         self.client = httpx.AsyncClient(
             base_url=self.api_url,
             headers=self.headers,
-            timeout=30.0
+            http2=True,
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=max(1, max_connections // 2),
+                max_connections=max_connections,
+                keepalive_expiry=keepalive_expiry
+            )
         )
 
+        # Retry policy for transient network errors (see _request)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = retry_backoff
+
+        # Caps in-flight requests for bulk operations so Plane isn't overwhelmed
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+        # Whether the server has a bulk issue endpoint (None until first probed)
+        self._supports_bulk_issues: Optional[bool] = None
+
+        # Short-lived cache for read-mostly GETs: url -> (fetched_at, body, last_modified).
+        # Raw bodies are kept so every caller gets its own decoded copy
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, bytes, Optional[str]]] = {}
+
     async def close(self):
         """Close the HTTP client"""
         await self.client.aclose()
 
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request, retrying transient failures with jittered backoff
+
+        Errors raised before the request reached the server are retried for
+        every method. Dropped keep-alive connections (the server closed an
+        idle socket just as we reused it) and 502/503/504 responses are only
+        retried for idempotent methods, so a POST is never sent twice.
+        """
+        idempotent = method in _IDEMPOTENT_METHODS
+
+        for attempt in range(self.max_attempts):
+            last_attempt = attempt == self.max_attempts - 1
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except _NOT_SENT_ERRORS:
+                if last_attempt:
+                    raise
+            except _STALE_CONNECTION_ERRORS:
+                if last_attempt or not idempotent:
+                    raise
+            else:
+                if response.status_code not in _RETRY_STATUSES or last_attempt or not idempotent:
+                    return response
+
+            await asyncio.sleep(self.retry_backoff * 2 ** attempt * random.random())
+
+    async def _cached_get(self, url: str) -> Any:
+        """
+        GET a URL through the TTL cache
+
+        Fresh entries are served without a request. Stale entries are
+        revalidated with If-Modified-Since, and a 304 counts as a hit.
+        Each call returns a newly decoded value, safe for the caller to mutate.
+        """
+        now = time.monotonic()
+        cached = self._cache.get(url)
+        if cached and now - cached[0] < self.cache_ttl:
+            return orjson.loads(cached[1])
+
+        headers = {}
+        if cached and cached[2]:
+            headers["If-Modified-Since"] = cached[2]
+
+        response = await self._request("GET", url, headers=headers)
+        if response.status_code == 304 and cached:
+            self._cache[url] = (now, cached[1], cached[2])
+            return orjson.loads(cached[1])
+
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        self._cache[url] = (now, response.content, response.headers.get("Last-Modified"))
+        return data
+
+    async def _send_json(self, method: str, url: str, payload: Any) -> httpx.Response:
+        """Send a JSON body encoded with orjson (the client sets Content-Type)"""
+        return await self._request(method, url, content=orjson.dumps(payload))
+
+    def _invalidate(self, *urls: str):
+        """Drop cached GETs made stale by a write"""
+        for url in urls:
+            self._cache.pop(url, None)
+
     # ==============================================================================
     # Workspace Management
     # ==============================================================================
@@ -71,21 +181,20 @@ class PlaneClient:
             }
         }
 
-        response = await self.client.post("/api/workspaces/", json=payload)
+        response = await self._send_json("POST", "/api/workspaces/", payload)
         response.raise_for_status()
-        return response.json()
+        self._invalidate(f"/api/workspaces/{slug}/")
+        return orjson.loads(response.content)
 
     async def get_workspace(self, workspace_slug: str) -> Dict[str, Any]:
         """Get workspace details"""
-        response = await self.client.get(f"/api/workspaces/{workspace_slug}/")
-        response.raise_for_status()
-        return response.json()
+        return await self._cached_get(f"/api/workspaces/{workspace_slug}/")
 
     async def list_workspaces(self) -> List[Dict[str, Any]]:
         """List all workspaces"""
-        response = await self.client.get("/api/workspaces/")
+        response = await self._request("GET", "/api/workspaces/")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     # ==============================================================================
     # Project Management
@@ -121,12 +230,14 @@ class PlaneClient:
             }
         }
 
-        response = await self.client.post(
+        response = await self._send_json(
+            "POST",
             f"/api/workspaces/{workspace_slug}/projects/",
-            json=payload
+            payload
         )
         response.raise_for_status()
-        return response.json()
+        self._invalidate(f"/api/workspaces/{workspace_slug}/projects/")
+        return orjson.loads(response.content)
 
     async def get_project(
         self,
@@ -134,19 +245,15 @@ class PlaneClient:
         project_id: str
     ) -> Dict[str, Any]:
         """Get project details"""
-        response = await self.client.get(
+        return await self._cached_get(
             f"/api/workspaces/{workspace_slug}/projects/{project_id}/"
         )
-        response.raise_for_status()
-        return response.json()
 
     async def list_projects(self, workspace_slug: str) -> List[Dict[str, Any]]:
         """List all projects in a workspace"""
-        response = await self.client.get(
+        return await self._cached_get(
             f"/api/workspaces/{workspace_slug}/projects/"
         )
-        response.raise_for_status()
-        return response.json()
 
     # ==============================================================================
     # Issue Management (Tasks)
@@ -177,7 +284,26 @@ class PlaneClient:
         Returns:
             Issue data including issue_id
         """
-        payload = {
+        payload = self._issue_payload(title, description, priority, assignee, velo_task_id)
+
+        response = await self._send_json(
+            "POST",
+            f"/api/workspaces/{workspace_slug}/projects/{project_id}/issues/",
+            payload
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def _issue_payload(
+        title: str,
+        description: str,
+        priority: str = "medium",
+        assignee: Optional[str] = None,
+        velo_task_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the request body for a new issue"""
+        return {
             "name": title,
             "description": description,
             "priority": priority,
@@ -188,13 +314,6 @@ class PlaneClient:
             }
         }
 
-        response = await self.client.post(
-            f"/api/workspaces/{workspace_slug}/projects/{project_id}/issues/",
-            json=payload
-        )
-        response.raise_for_status()
-        return response.json()
-
     async def bulk_create_issues(
         self,
         workspace_slug: str,
@@ -210,22 +329,62 @@ class PlaneClient:
             issues: List of issue dictionaries
 
         Returns:
-            List of created issue data
+            List of created issue data, in the order of issues
+
+        Raises:
+            ValueError: if the bulk endpoint reports a different number of
+                created issues than were sent
         """
-        results = []
-        for issue_data in issues:
-            result = await self.create_issue(
-                workspace_slug=workspace_slug,
-                project_id=project_id,
-                title=issue_data.get('title'),
-                description=issue_data.get('description', ''),
-                priority=issue_data.get('priority', 'medium'),
-                assignee=issue_data.get('assignee'),
-                velo_task_id=issue_data.get('velo_task_id')
+        if not issues:
+            return []
+
+        # Prefer one bulk request; the first call probes whether the server supports it
+        if self._supports_bulk_issues is not False:
+            response = await self._send_json(
+                "POST",
+                f"/api/workspaces/{workspace_slug}/projects/{project_id}/issues/bulk/",
+                {"issues": [
+                    self._issue_payload(
+                        title=issue_data.get('title'),
+                        description=issue_data.get('description', ''),
+                        priority=issue_data.get('priority', 'medium'),
+                        assignee=issue_data.get('assignee'),
+                        velo_task_id=issue_data.get('velo_task_id')
+                    )
+                    for issue_data in issues
+                ]}
             )
-            results.append(result)
-
-        return results
+            if response.status_code not in (404, 405, 501):
+                response.raise_for_status()
+                self._supports_bulk_issues = True
+                created = orjson.loads(response.content)
+                if isinstance(created, dict):
+                    created = created.get('issues', [])
+                # Some may have been created, so retrying per issue could duplicate them
+                if len(created) != len(issues):
+                    raise ValueError(
+                        f"Bulk issue create returned {len(created)} issues for {len(issues)} sent"
+                    )
+                return created
+            # A 404 may only mean this workspace or project is missing, so
+            # just this call falls back; 405/501 mean no bulk endpoint
+            if response.status_code != 404:
+                self._supports_bulk_issues = False
+
+        # Fallback: one request per issue, sent concurrently
+        async def create_one(issue_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with self._semaphore:
+                return await self.create_issue(
+                    workspace_slug=workspace_slug,
+                    project_id=project_id,
+                    title=issue_data.get('title'),
+                    description=issue_data.get('description', ''),
+                    priority=issue_data.get('priority', 'medium'),
+                    assignee=issue_data.get('assignee'),
+                    velo_task_id=issue_data.get('velo_task_id')
+                )
+
+        return list(await asyncio.gather(*(create_one(issue_data) for issue_data in issues)))
 
     async def update_issue(
         self,
@@ -246,12 +405,13 @@ class PlaneClient:
         Returns:
             Updated issue data
         """
-        response = await self.client.patch(
+        response = await self._send_json(
+            "PATCH",
             f"/api/workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/",
-            json=updates
+            updates
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def update_issue_status(
         self,
@@ -280,11 +440,12 @@ class PlaneClient:
         issue_id: str
     ) -> Dict[str, Any]:
         """Get issue details"""
-        response = await self.client.get(
+        response = await self._request(
+            "GET",
             f"/api/workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/"
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def list_issues(
         self,
@@ -305,12 +466,13 @@ class PlaneClient:
         """
         params = filters or {}
 
-        response = await self.client.get(
+        response = await self._request(
+            "GET",
             f"/api/workspaces/{workspace_slug}/projects/{project_id}/issues/",
             params=params
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     # ==============================================================================
     # Comments
@@ -326,15 +488,16 @@ class PlaneClient:
         """Add a comment to an issue"""
         payload = {
             "comment": comment,
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": datetime.now(timezone.utc).isoformat()
         }
 
-        response = await self.client.post(
+        response = await self._send_json(
+            "POST",
             f"/api/workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/comments/",
-            json=payload
+            payload
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     # ==============================================================================
     # Helper Methods
@@ -355,8 +518,12 @@ class PlaneClient:
         Returns:
             Dictionary with workspace details
         """
-        # Create slug from company name
-        slug = company_name.lower().replace(' ', '-').replace('_', '-')
+        # Create slug from company name, folding accents to ASCII ("Café" -> "cafe")
+        ascii_name = unicodedata.normalize('NFKD', company_name).encode('ascii', 'ignore').decode()
+        slug = _SLUG_SEPARATOR_RE.sub('-', ascii_name.lower()).strip('-')
+        if not slug:
+            # Nothing transliterates (e.g. CJK names): derive it from the tenant
+            slug = "velo-" + _SLUG_SEPARATOR_RE.sub('', tenant_id.lower())[:8]
 
         # Create workspace
         workspace = await self.create_workspace(
@@ -1,13 +1,368 @@
 """
 Vertex AI Integration
-Client for Google Cloud Vertex AI (Gemini 1.5 Pro)
+Client for Google Cloud Vertex AI (Gemini 1.5 Pro and Flash)
 """
 
 import os
-from typing import Dict, List, Any, Optional, AsyncIterator
+import asyncio
+import hashlib
+import logging
+import functools
+import string
+from datetime import timedelta
+from typing import Dict, List, Any, Optional, AsyncIterator, Tuple, Union
+from google.api_core import exceptions as google_exceptions
 from google.cloud import aiplatform
-from vertexai.generative_models import GenerativeModel, GenerationConfig
+from google.cloud.aiplatform import initializer as aiplatform_initializer
+from google.cloud.aiplatform_v1beta1.services import prediction_service
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from vertexai.generative_models import FinishReason, GenerativeModel, GenerationConfig
+from vertexai.preview import caching
+from vertexai.preview.generative_models import GenerativeModel as PreviewGenerativeModel
 import vertexai
+import jiter
+import orjson
+import diskcache
+
+logger = logging.getLogger("velo.vertex")
+
+# Quota and overload errors are retried with jittered exponential backoff
+RETRYABLE_ERRORS = (google_exceptions.ResourceExhausted, google_exceptions.ServiceUnavailable)
+RETRY_ATTEMPTS = 5
+
+# Response cache for near-deterministic generations (temperature <= 0.3)
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.3
+RESPONSE_CACHE_TTL = 7 * 24 * 3600
+RESPONSE_CACHE_SIZE_LIMIT = 512 * 1024 * 1024
+
+# Context caching: Gemini only caches contexts of at least 32,768 tokens
+# (~4 characters each); smaller contexts are sent inline as before
+CONTEXT_CACHE_MIN_CHARS = 32768 * 4
+CONTEXT_CACHE_TTL = timedelta(hours=1)
+
+# Chat history prefixes are cached at multiples of this many turns (cached
+# contents can't be appended to, so a longer prefix is a new cache)
+CHAT_CACHE_REFRESH_TURNS = 8
+
+# validate_code_batch packs this many items per request (about 1K output
+# tokens each, within Gemini's 8K output limit)
+VALIDATION_BATCH_SIZE = 8
+
+# Inputs above this many characters are assembled/parsed in a worker thread
+OFFLOAD_MIN_CHARS = 64 * 1024
+
+# Output token caps per call kind: (floor, ceiling, prompt chars per token).
+# Floors are the former fixed caps where a truncated answer is unusable
+# (a cut-off validation object falls back to a default result)
+_OUTPUT_TOKEN_BUDGETS = {
+    "prd": (8192, 8192, 1),
+    "validation": (2048, 4096, 8),
+    "diagram": (512, 2048, 4),
+    "chat": (4096, 8192, 2),
+}
+
+# Prompt sections, pre-encoded so prompts are assembled in a single buffer
+_HDR_TASK = b"# Task\n"
+_HDR_LANGUAGE = b"\n\n# Language\n"
+_HDR_EXISTING_CODE = b"\n\n# Existing Code\n```"
+_HDR_REQUIREMENTS = b"\n\n# Requirements\n"
+_HDR_DESIGN_SYSTEM = b"\n\n# Design System\n"
+_HDR_PRODUCT_REQUIREMENTS = b"\n\n# Product Requirements\n"
+_HDR_CODEBASE = b"\n\n# Codebase Overview\n"
+_HDR_ARCHITECTURE = b"\n\n# Architecture\n"
+_FENCE_END = b"\n```"
+_CODE_INSTRUCTIONS = b"\n\n# Instructions\nGenerate production-ready code following best practices."
+_DOC_INSTRUCTIONS = b"\n\nGenerate clear, comprehensive documentation in Markdown format."
+
+_DOC_TASKS = {
+    "user_manual": b"Generate a comprehensive user manual for end users",
+    "deployment_guide": b"Generate a detailed deployment guide for DevOps teams",
+    "api_docs": b"Generate API documentation with examples",
+    "architecture_doc": b"Generate architecture documentation with diagrams",
+    "test_report": b"Generate a QA test report summarizing test results"
+}
+_DOC_TASK_DEFAULT = b"Generate documentation"
+
+# Prompt scaffolds, parsed once at import and filled with Template.substitute
+_PRD_TMPL = string.Template("""Generate a comprehensive Product Requirements Document (PRD) for the following project:
+
+${user_prompt}
+
+The PRD should include:
+1. Overview and Vision
+2. Target Users
+3. Key Features (detailed)
+4. Technical Requirements
+5. Success Criteria
+6. Timeline Estimate
+7. Risks and Mitigation
+
+Format the output as a well-structured Markdown document.""")
+
+_TASKS_TMPL = string.Template("""Analyze the ${prd_ref} and break it down into concrete, actionable tasks:${prd_block}
+
+For each task, provide:
+1. Title (concise)
+2. Description (detailed)
+3. Assigned agent (choose from: pixel, atlas, nova, neuron, aurora, etc.)
+4. Priority (low, medium, high, urgent)
+5. Estimated effort (hours)
+6. Dependencies (other task titles)
+
+Return the tasks as a JSON array.""")
+
+_VALIDATION_TMPL = string.Template("""Review the following ${language} code against the requirements:
+
+# Requirements
+${requirements}
+
+# Code
+```${language}
+${code}
+```
+
+Analyze the code for:
+1. Correctness - Does it meet the requirements?
+2. Best Practices - Does it follow language conventions?
+3. Security - Are there any security issues?
+4. Performance - Are there obvious performance issues?
+5. Error Handling - Is error handling adequate?
+6. Code Quality - Is it maintainable and readable?
+
+Return a JSON object with:
+- "passed": boolean (true if code passes all checks)
+- "issues": array of issue objects with "severity", "category", and "description"
+- "suggestions": array of improvement suggestions
+- "score": number 0-100 (overall quality score)""")
+
+_VALIDATION_ITEM_TMPL = string.Template("""## Item ${number}
+
+# Requirements
+${requirements}
+
+# Code
+```${language}
+${code}
+```""")
+
+_VALIDATION_BATCH_TMPL = string.Template("""Review each of the following ${count} code items against its requirements:
+
+${items_block}
+
+Analyze each item for:
+1. Correctness - Does it meet the requirements?
+2. Best Practices - Does it follow language conventions?
+3. Security - Are there any security issues?
+4. Performance - Are there obvious performance issues?
+5. Error Handling - Is error handling adequate?
+6. Code Quality - Is it maintainable and readable?
+
+Return a JSON array of ${count} validation objects in the same order as the items, each with:
+- "passed": boolean (true if code passes all checks)
+- "issues": array of issue objects with "severity", "category", and "description"
+- "suggestions": array of improvement suggestions
+- "score": number 0-100 (overall quality score)""")
+
+_DIAGRAM_TMPL = string.Template("""Based on the PRD and tech stack, generate a Mermaid.js architecture diagram:
+
+${prd_block}# Tech Stack
+${tech_stack}
+
+Generate a Mermaid.js diagram showing:
+1. System components
+2. Data flow
+3. External integrations
+4. Database relationships
+
+Return ONLY the Mermaid.js code wrapped in a code block.""")
+
+
+def _load_json(data: bytes, partial: bool = False) -> Any:
+    """
+    Decode JSON bytes with jiter
+
+    With partial, the data is a truncated document and what parsed
+    completely is returned instead of raising: incomplete strings are
+    dropped, and so is the last element of a top-level array, which may
+    have been cut off mid-object.
+
+    Raises:
+        ValueError: if the data isn't valid JSON
+    """
+    if not partial:
+        return jiter.from_json(data)
+
+    value = jiter.from_json(data, partial_mode="on")
+    if isinstance(value, list):
+        del value[-1:]
+    return value
+
+
+def _fenced_json_span(buf: bytes) -> Tuple[int, int]:
+    """
+    Offsets of the body of the first markdown code fence in a response
+
+    Prefers a ```json fence, then any fence; without one the whole buffer
+    is used. The closing fence only matches at the start of a line, which
+    can't occur inside a JSON string (newlines there are escaped). An
+    unclosed fence (truncated response) runs to the end.
+    """
+    i = buf.find(b"```json")
+    if i != -1:
+        start = i + 7
+    else:
+        i = buf.find(b"```")
+        if i == -1:
+            return 0, len(buf)
+        start = i + 3
+
+    end = buf.find(b"\n```", start)
+    return start, end if end != -1 else len(buf)
+
+
+def _extract_json(text: Union[str, bytes], partial: bool = True) -> Any:
+    """
+    Parse the JSON object or array in a model response
+
+    Locates the value by offset (fence body, then outermost brackets)
+    without building intermediate strings; only the final slice is copied.
+    With partial, a response cut off mid-value still parses (only the
+    complete items are kept).
+
+    Raises:
+        ValueError: if the response contains no parseable JSON
+    """
+    buf = text.encode('utf-8') if isinstance(text, str) else text
+    lo, hi = _fenced_json_span(buf)
+
+    # First opening bracket of either kind
+    starts = [i for i in (buf.find(b'{', lo, hi), buf.find(b'[', lo, hi)) if i != -1]
+    if not starts:
+        raise ValueError("No JSON value in response")
+    start = min(starts)
+
+    # Cut at the last matching closing bracket to drop trailing prose
+    end = buf.rfind(b'}' if buf[start] == ord('{') else b']', start, hi)
+    if end != -1:
+        try:
+            return _load_json(buf[start:end + 1])
+        except ValueError:
+            if not partial:
+                raise
+    elif not partial:
+        raise ValueError("Unterminated JSON value in response")
+
+    # Truncated response: the last bracket may belong to a nested value,
+    # so parse everything from the opening bracket leniently
+    return _load_json(buf[start:hi], partial=True)
+
+
+def _build_code_prompt(
+    task_description: str,
+    context: Optional[Dict[str, Any]],
+    language: str
+) -> str:
+    """Assemble the generate_code prompt"""
+    lang = language.encode('utf-8')
+
+    buf = bytearray(_HDR_TASK)
+    buf += task_description.encode('utf-8')
+    buf += _HDR_LANGUAGE
+    buf += lang
+
+    if context:
+        if context.get('existing_code'):
+            buf += _HDR_EXISTING_CODE
+            buf += lang
+            buf += b"\n"
+            buf += context['existing_code'].encode('utf-8')
+            buf += _FENCE_END
+        if context.get('requirements'):
+            buf += _HDR_REQUIREMENTS
+            buf += context['requirements'].encode('utf-8')
+        if context.get('design_system'):
+            buf += _HDR_DESIGN_SYSTEM
+            buf += context['design_system'].encode('utf-8')
+
+    buf += _CODE_INSTRUCTIONS
+
+    return buf.decode('utf-8')
+
+
+def _build_documentation_context(content_context: Dict[str, Any]) -> str:
+    """Assemble the shared project context sections for generate_documentation"""
+    buf = bytearray()
+    if content_context.get('prd'):
+        buf += _HDR_PRODUCT_REQUIREMENTS
+        buf += content_context['prd'].encode('utf-8')
+    if content_context.get('code'):
+        buf += _HDR_CODEBASE
+        buf += content_context['code'].encode('utf-8')
+    if content_context.get('architecture'):
+        buf += _HDR_ARCHITECTURE
+        buf += content_context['architecture'].encode('utf-8')
+
+    return buf.decode('utf-8')
+
+
+def _context_cache_key(model_name: str, system_prompt: str, context: str) -> str:
+    """Key a context cache by hash of (model, system prompt, context)"""
+    return hashlib.sha256(
+        "\0".join((model_name, system_prompt, context)).encode('utf-8')
+    ).hexdigest()
+
+
+def _estimate_output_tokens(kind: str, prompt_len: int) -> int:
+    """
+    Output token cap for a call, scaled from its prompt length
+
+    The cap only stops runaway generations, so each floor leaves room for a
+    typical full answer of that kind.
+
+    Args:
+        kind: Entry in _OUTPUT_TOKEN_BUDGETS
+        prompt_len: Prompt length in characters
+
+    Returns:
+        max_output_tokens value
+    """
+    floor, ceiling, chars_per_token = _OUTPUT_TOKEN_BUDGETS[kind]
+    return min(ceiling, max(floor, prompt_len // chars_per_token))
+
+
+def _warn_if_truncated(response) -> None:
+    """Log a response (or final stream chunk) cut off by max_output_tokens"""
+    candidates = getattr(response, "candidates", None)
+    if candidates and candidates[0].finish_reason == FinishReason.MAX_TOKENS:
+        logger.warning("Vertex AI response truncated at max_output_tokens")
+
+
+async def _run_sized(size: int, func, *args) -> Any:
+    """
+    Run a CPU-bound helper, in a worker thread when its input is large
+
+    Keeps big prompt assembly and response parsing from stalling other
+    coroutines; small inputs run inline since a thread hop costs more.
+    """
+    if size > OFFLOAD_MIN_CHARS:
+        return await asyncio.to_thread(func, *args)
+    return func(*args)
+
+
+@functools.lru_cache(maxsize=64)
+def _generation_config(
+    temperature: float,
+    top_p: float,
+    top_k: int,
+    max_output_tokens: int
+) -> GenerationConfig:
+    """Shared GenerationConfig per parameter tuple (callers use only a handful)"""
+    return GenerationConfig(
+        temperature=temperature,
+        top_p=top_p,
+        top_k=top_k,
+        max_output_tokens=max_output_tokens,
+    )
 
 
 class VertexAIClient:
@@ -19,11 +374,35 @@ class VertexAIClient:
         self,
         project_id: Optional[str] = None,
         location: Optional[str] = None,
-        model_name: str = "gemini-1.5-pro"
+        model_name: str = "gemini-1.5-pro",
+        model_name_flash: str = "gemini-1.5-flash",
+        batch_max: int = 8,
+        batch_window_ms: float = 20.0,
+        max_concurrency: int = 32
     ):
         self.project_id = project_id or os.getenv("GOOGLE_CLOUD_PROJECT")
         self.location = location or os.getenv("VERTEX_AI_LOCATION", "us-central1")
+        # Pro for generation (code, PRDs, docs); Flash for lighter calls
+        # (validation, task breakdown, diagrams, chat)
         self.model_name = model_name
+        self.model_name_flash = model_name_flash
+
+        # Request batching: generate_content calls are queued and a worker
+        # dispatches up to batch_max at a time, waiting at most
+        # batch_window_ms for a batch to fill
+        self.batch_max = max(1, batch_max)
+        self.batch_window = batch_window_ms / 1000
+        self.max_concurrency = max_concurrency
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._batches: set = set()
+
+        # Identical requests in flight, by request key: [future, waiters]
+        self._inflight: Dict[str, list] = {}
+
+        # Pending response cache writes (sqlite runs off the event loop)
+        self._cache_writes: set = set()
 
         if not self.project_id:
             raise ValueError("GOOGLE_CLOUD_PROJECT environment variable or project_id parameter required")
@@ -31,8 +410,48 @@ class VertexAIClient:
         # Initialize Vertex AI
         vertexai.init(project=self.project_id, location=self.location)
 
-        # Initialize the model
-        self.model = GenerativeModel(self.model_name)
+        # Models per (model name, system instruction); agents use a small
+        # fixed set of system prompts so this stays small
+        self._model_cache: Dict[tuple, GenerativeModel] = {}
+
+        # On-disk response cache, shared by processes using the same directory
+        self._response_cache = diskcache.Cache(
+            os.getenv("VERTEX_CACHE_DIR", ".vertex_cache"),
+            size_limit=RESPONSE_CACHE_SIZE_LIMIT
+        )
+
+        # Context caches per hash of (model, system prompt, context); None
+        # marks a context the service refused to cache
+        self._context_caches: Dict[str, Optional[caching.CachedContent]] = {}
+        self._context_cache_lock: Optional[asyncio.Lock] = None
+        self._cache_refresher: Optional[asyncio.Task] = None
+        # Loop time each context cache was last handed out; caches unused
+        # for a refresh interval are left to expire
+        self._context_cache_used: Dict[str, float] = {}
+
+    @property
+    def model(self) -> GenerativeModel:
+        """Pro model without a system instruction"""
+        return self._get_model()
+
+    @property
+    def model_flash(self) -> GenerativeModel:
+        """Flash model without a system instruction"""
+        return self._get_model(model_name=self.model_name_flash)
+
+    @functools.cached_property
+    def _prediction_client(self) -> prediction_service.PredictionServiceAsyncClient:
+        """
+        Prediction client shared by every cached model
+
+        The SDK otherwise builds one per GenerativeModel, each with its own
+        gRPC channel. Created on first use, on the running event loop.
+        """
+        return aiplatform_initializer.global_config.create_client(
+            client_class=prediction_service.PredictionServiceAsyncClient,
+            location_override=self.location,
+            prediction_client=True,
+        )
 
     def create_generation_config(
         self,
@@ -53,12 +472,131 @@ class VertexAIClient:
         Returns:
             GenerationConfig object
         """
-        return GenerationConfig(
-            temperature=temperature,
-            top_p=top_p,
-            top_k=top_k,
-            max_output_tokens=max_output_tokens,
-        )
+        return _generation_config(temperature, top_p, top_k, max_output_tokens)
+
+    def _get_model(
+        self,
+        system_instruction: Optional[str] = None,
+        cached_content: Optional[caching.CachedContent] = None,
+        model_name: Optional[str] = None
+    ) -> GenerativeModel:
+        """
+        Get the model for a system instruction or context cache, creating it
+        on first use
+
+        Construction is synchronous, so two coroutines can't race to create
+        the same entry and no lock is needed.
+        """
+        model_name = model_name or self.model_name
+
+        if cached_content is not None:
+            # The cache already holds the system instruction
+            key = (model_name, "cache:" + cached_content.resource_name)
+        else:
+            key = (model_name, system_instruction or "")
+
+        model = self._model_cache.get(key)
+        if model is None:
+            if cached_content is not None:
+                model = PreviewGenerativeModel.from_cached_content(cached_content=cached_content)
+            elif system_instruction:
+                model = GenerativeModel(model_name, system_instruction=[system_instruction])
+            else:
+                model = GenerativeModel(model_name)
+            # Overrides the SDK's per-model cached_property
+            model._prediction_async_client = self._prediction_client
+            self._model_cache[key] = model
+        return model
+
+    async def _context_cache(
+        self,
+        system_prompt: str,
+        context: str,
+        model_name: Optional[str] = None
+    ) -> Optional[caching.CachedContent]:
+        """
+        Get a server-side context cache holding a system prompt and a large
+        shared context (PRD, codebase), creating it on first use
+
+        Later calls reference the cache instead of re-sending those tokens.
+        Returns None when the context is too small to cache or the service
+        refuses it (e.g. an unversioned model name); callers then send the
+        context inline.
+        """
+        if len(context) < CONTEXT_CACHE_MIN_CHARS:
+            return None
+
+        model_name = model_name or self.model_name
+        key = _context_cache_key(model_name, system_prompt, context)
+        self._context_cache_used[key] = asyncio.get_running_loop().time()
+        if key in self._context_caches:
+            return self._context_caches[key]
+
+        if self._context_cache_lock is None:
+            self._context_cache_lock = asyncio.Lock()
+
+        async with self._context_cache_lock:
+            if key in self._context_caches:
+                return self._context_caches[key]
+
+            try:
+                cached = await asyncio.to_thread(
+                    caching.CachedContent.create,
+                    model_name=model_name,
+                    system_instruction=system_prompt,
+                    contents=[context],
+                    ttl=CONTEXT_CACHE_TTL
+                )
+            except Exception as e:
+                logger.warning("Context caching unavailable, sending context inline: %s", e)
+                cached = None
+
+            self._context_caches[key] = cached
+
+        if cached is not None and (self._cache_refresher is None or self._cache_refresher.done()):
+            self._cache_refresher = asyncio.get_running_loop().create_task(self._refresh_context_caches())
+
+        return cached
+
+    def _forget_context_cache(self, key: str):
+        """Stop using a context cache and evict the models bound to it"""
+        cached = self._context_caches.pop(key, None)
+        self._context_cache_used.pop(key, None)
+        if cached is None:
+            return
+
+        tag = "cache:" + cached.resource_name
+        for model_key in [k for k in self._model_cache if k[1] == tag]:
+            del self._model_cache[model_key]
+
+    async def _refresh_context_caches(self):
+        """
+        Extend the TTL of context caches in use every half TTL
+
+        Caches not handed out since the previous pass (e.g. superseded chat
+        prefixes) are forgotten rather than extended and expire server-side.
+        Requests still using one finish well within its remaining TTL, so
+        they are never deleted out from under a caller.
+        """
+        interval = CONTEXT_CACHE_TTL.total_seconds() / 2
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await asyncio.sleep(interval)
+
+            now = loop.time()
+            for key, cached in list(self._context_caches.items()):
+                if cached is None:
+                    continue
+                if now - self._context_cache_used.get(key, 0.0) > interval:
+                    self._forget_context_cache(key)
+                    continue
+                try:
+                    await asyncio.to_thread(cached.update, ttl=CONTEXT_CACHE_TTL)
+                except Exception as e:
+                    # Expired or deleted server-side; recreate on next use
+                    logger.warning("Dropping context cache %s: %s", cached.resource_name, e)
+                    self._forget_context_cache(key)
 
     async def generate_content(
         self,
@@ -66,47 +604,433 @@ class VertexAIClient:
         system_instruction: Optional[str] = None,
         temperature: float = 0.7,
         max_output_tokens: int = 8192,
-    ) -> str:
+        cached_content: Optional[caching.CachedContent] = None,
+        stream: bool = False,
+        cache: bool = True,
+        model_name: Optional[str] = None,
+    ) -> Union[str, AsyncIterator[str]]:
         """
         Generate content using Gemini
 
+        Responses to low-temperature requests are cached on disk, and
+        identical requests made while one is in flight share its result.
+
         Args:
             prompt: User prompt
             system_instruction: System instruction for the model
             temperature: Creativity level (0.0-1.0)
             max_output_tokens: Maximum response length
+            cached_content: Context cache to use instead of system_instruction
+            stream: Return an async iterator of text chunks instead
+            cache: Set False to always make a new model call
+            model_name: Model to use (defaults to the Pro model)
+
+        Returns:
+            Generated text content, or an iterator over it when streaming
+        """
+        model_name = model_name or self.model_name
+
+        if stream:
+            return self.generate_content_stream(
+                prompt,
+                system_instruction=system_instruction,
+                temperature=temperature,
+                max_output_tokens=max_output_tokens,
+                cached_content=cached_content,
+                model_name=model_name
+            )
+
+        text = await self._generate_shared(
+            prompt, system_instruction, temperature, max_output_tokens, cached_content, cache, model_name
+        )
+        return text.decode('utf-8') if isinstance(text, bytes) else text
+
+    async def _generate_content_bytes(
+        self,
+        prompt: str,
+        system_instruction: Optional[str] = None,
+        temperature: float = 0.7,
+        max_output_tokens: int = 8192,
+        cached_content: Optional[caching.CachedContent] = None,
+        cache: bool = True,
+        model_name: Optional[str] = None,
+    ) -> bytes:
+        """
+        generate_content for callers that parse the response as bytes
+
+        Disk cache hits are returned as stored, skipping the UTF-8 decode
+        and re-encode; fresh responses are encoded once. The SDK only
+        exposes the response as str, so that encode can't be avoided.
+        """
+        text = await self._generate_shared(
+            prompt, system_instruction, temperature, max_output_tokens, cached_content, cache,
+            model_name or self.model_name
+        )
+        return text if isinstance(text, bytes) else text.encode('utf-8')
+
+    async def _generate_shared(
+        self,
+        prompt: str,
+        system_instruction: Optional[str],
+        temperature: float,
+        max_output_tokens: int,
+        cached_content: Optional[caching.CachedContent],
+        cache: bool,
+        model_name: str
+    ) -> Union[str, bytes]:
+        """
+        Make a non-streaming request through the disk cache and the
+        in-flight map
 
         Returns:
-            Generated text content
+            The response text, or its UTF-8 bytes on a disk cache hit
         """
         config = self.create_generation_config(
             temperature=temperature,
             max_output_tokens=max_output_tokens
         )
 
-        # Create model with system instruction if provided
-        if system_instruction:
-            model = GenerativeModel(
-                self.model_name,
-                system_instruction=[system_instruction]
-            )
-        else:
-            model = self.model
+        if not cache:
+            return await self._submit_nowait(prompt, config, system_instruction, cached_content, model_name)
+
+        key = self._request_key(prompt, system_instruction, temperature, max_output_tokens, cached_content, model_name)
+        use_cache = temperature <= RESPONSE_CACHE_MAX_TEMPERATURE
+        if use_cache:
+            text = await asyncio.to_thread(self._response_cache.get, key)
+            if text is not None:
+                return text
+
+        # An identical request is already in flight; share its result.
+        # No await separates this check from registering below, so the map
+        # needs no lock.
+        entry = self._inflight.get(key)
+        if entry is None:
+            future = self._submit_nowait(prompt, config, system_instruction, cached_content, model_name)
+
+            entry = [future, 0]
+            self._inflight[key] = entry
+            future.add_done_callback(lambda f: self._request_done(key, entry, use_cache))
+
+        return await self._await_shared(entry)
+
+    def _submit_nowait(
+        self,
+        prompt: str,
+        config: GenerationConfig,
+        system_instruction: Optional[str],
+        cached_content: Optional[caching.CachedContent],
+        model_name: str
+    ) -> asyncio.Future:
+        """Queue a request for the batch worker and return its future"""
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(({
+            "prompt": prompt,
+            "config": config,
+            "system_instruction": system_instruction,
+            "cached_content": cached_content,
+            "model_name": model_name,
+        }, future))
+        return future
+
+    async def _await_shared(self, entry: list) -> str:
+        """
+        Wait on an in-flight request shared by identical callers
+
+        A caller being cancelled doesn't cancel the others; the request
+        itself is only cancelled once every caller has given up.
+        """
+        future = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            entry[1] -= 1
+            if entry[1] == 0:
+                future.cancel()
+            raise
+
+    def _request_done(self, key: str, entry: list, use_cache: bool):
+        """Cache a finished in-flight request's response, then unregister it"""
+        future = entry[0]
+        if not use_cache or future.cancelled() or future.exception() is not None:
+            self._forget_inflight(key, entry)
+            return
+
+        # Stored as UTF-8 bytes (a BLOB), which JSON callers parse as-is. The
+        # finished entry keeps answering identical requests until the write
+        # has landed.
+        write = asyncio.get_running_loop().create_task(asyncio.to_thread(
+            self._response_cache.set, key, future.result().encode('utf-8'), expire=RESPONSE_CACHE_TTL
+        ))
+        self._cache_writes.add(write)
+        write.add_done_callback(lambda w: self._cache_write_done(w, key, entry))
+
+    def _cache_write_done(self, write: asyncio.Task, key: str, entry: list):
+        """Finish a response cache write started by _request_done"""
+        self._cache_writes.discard(write)
+        self._forget_inflight(key, entry)
+        if not write.cancelled() and write.exception() is not None:
+            logger.warning("Failed to cache response: %s", write.exception())
+
+    def _forget_inflight(self, key: str, entry: list):
+        """Remove an in-flight entry unless a newer request replaced it"""
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+
+    def _request_key(
+        self,
+        prompt: str,
+        system_instruction: Optional[str],
+        temperature: float,
+        max_output_tokens: int,
+        cached_content: Optional[caching.CachedContent],
+        model_name: str
+    ) -> str:
+        """Content hash identifying a generate_content request"""
+        return hashlib.sha256(orjson.dumps({
+            "m": model_name,
+            "p": prompt,
+            "s": system_instruction,
+            "c": cached_content.resource_name if cached_content is not None else None,
+            "t": temperature,
+            "mo": max_output_tokens,
+        }, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    async def generate_content_stream(
+        self,
+        prompt: str,
+        system_instruction: Optional[str] = None,
+        temperature: float = 0.7,
+        max_output_tokens: int = 8192,
+        cached_content: Optional[caching.CachedContent] = None,
+        model_name: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generate content using Gemini, yielding text as it arrives
+
+        Streams bypass the batch queue but count against max_concurrency
+        for as long as they are open.
+
+        Args:
+            prompt: User prompt
+            system_instruction: System instruction for the model
+            temperature: Creativity level (0.0-1.0)
+            max_output_tokens: Maximum response length
+            cached_content: Context cache to use instead of system_instruction
+            model_name: Model to use (defaults to the Pro model)
 
-        response = await model.generate_content_async(
-            prompt,
-            generation_config=config
+        Yields:
+            Text chunks
+        """
+        config = self.create_generation_config(
+            temperature=temperature,
+            max_output_tokens=max_output_tokens
         )
+        self._ensure_worker()
+        model = self._get_model(system_instruction, cached_content, model_name)
+
+        async with self._semaphore:
+            # Only opening the stream is retried; a failure mid-stream would
+            # otherwise replay chunks the caller already has
+            async for attempt in self._retrying():
+                with attempt:
+                    responses = await model.generate_content_async(
+                        prompt,
+                        generation_config=config,
+                        stream=True
+                    )
+            blocked = None
+            yielded = False
+            async for chunk in responses:
+                _warn_if_truncated(chunk)
+                try:
+                    text = chunk.text
+                except ValueError as e:
+                    # Chunks carrying only finish reason / usage metadata have no text
+                    blocked = e
+                    continue
+                yielded = True
+                yield text
+
+            # Nothing but text-less chunks: a blocked or empty response,
+            # raised like response.text does for a non-streamed call
+            if not yielded and blocked is not None:
+                raise blocked
+
+    async def _generate_json_stream(self, partial: bool = True, **kwargs) -> Any:
+        """
+        Stream a JSON response and parse it
+
+        Stops reading as soon as the accumulated text holds a complete JSON
+        value, skipping any closing fence or commentary the model adds.
+        Otherwise the full (possibly truncated) response is parsed, leniently
+        if partial is set.
+
+        Returns:
+            The parsed value, or None if the response contains no parseable
+            JSON. Errors from the model call itself (including ValueError for
+            a blocked response) propagate.
+        """
+        buf = bytearray()
+        responses = self.generate_content_stream(**kwargs)
+        try:
+            async for chunk in responses:
+                buf += chunk.encode('utf-8')
+
+                # Only a closing bracket can complete the value
+                if '}' in chunk or ']' in chunk:
+                    try:
+                        return await _run_sized(len(buf), _extract_json, bytes(buf), False)
+                    except ValueError:
+                        pass
+        finally:
+            await responses.aclose()
+
+        try:
+            return await _run_sized(len(buf), _extract_json, bytes(buf), partial)
+        except ValueError:
+            return None
+
+    def _ensure_worker(self):
+        """Start the batch worker on the running loop if it isn't running"""
+        if self._worker is not None and not self._worker.done():
+            return
+
+        self._queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._worker = asyncio.get_running_loop().create_task(self._batch_loop())
+
+    async def _batch_loop(self):
+        """
+        Collect queued requests into batches and dispatch them
+
+        A request that arrives alone is dispatched at once. When others are
+        already queued behind it, the batch closes when it holds batch_max
+        requests or batch_window has passed since its first request arrived.
+        Each batch runs as its own task, so the next batch can be collected
+        while earlier ones are in flight; the semaphore caps total concurrent
+        RPCs.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+
+            while len(batch) < self.batch_max and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if len(batch) == 1:
+                # No burst in progress: waiting would only add latency
+                deadline = loop.time()
+
+            while len(batch) < self.batch_max:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Keep a reference so in-flight batches aren't garbage collected
+            task = loop.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: List[tuple]):
+        """Run a batch of requests concurrently and resolve their futures"""
+        await asyncio.gather(*(self._run_request(*item) for item in batch))
+
+    async def _run_request(self, request: Dict[str, Any], future: asyncio.Future):
+        """Run a single queued request, bounded by the concurrency semaphore"""
+        if future.done():
+            # Caller was cancelled while queued
+            return
+
+        try:
+            async with self._semaphore:
+                text = await self._call_model(**request)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(text)
+
+    async def _call_model(
+        self,
+        prompt: str,
+        config: GenerationConfig,
+        system_instruction: Optional[str] = None,
+        cached_content: Optional[caching.CachedContent] = None,
+        model_name: Optional[str] = None
+    ) -> str:
+        """Issue one generate_content RPC and return the response text"""
+        model = self._get_model(system_instruction, cached_content, model_name)
+
+        async for attempt in self._retrying():
+            with attempt:
+                response = await model.generate_content_async(
+                    prompt,
+                    generation_config=config
+                )
 
+        _warn_if_truncated(response)
         return response.text
 
+    @staticmethod
+    def _retrying() -> AsyncRetrying:
+        """Retry policy for transient Vertex AI errors (backoff sleeps are async)"""
+        return AsyncRetrying(
+            stop=stop_after_attempt(RETRY_ATTEMPTS),
+            wait=wait_exponential_jitter(initial=0.5, max=8),
+            retry=retry_if_exception_type(RETRYABLE_ERRORS),
+            reraise=True
+        )
+
+    async def close(self):
+        """Stop the batch worker and release context caches"""
+        for attr in ("_worker", "_cache_refresher"):
+            task = getattr(self, attr)
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                setattr(self, attr, None)
+
+        # Caches are billed for storage until they expire
+        for cached in self._context_caches.values():
+            if cached is not None:
+                try:
+                    await asyncio.to_thread(cached.delete)
+                except Exception as e:
+                    logger.warning("Failed to delete context cache %s: %s", cached.resource_name, e)
+        self._context_caches.clear()
+        self._context_cache_used.clear()
+
+        if self._cache_writes:
+            await asyncio.gather(*self._cache_writes, return_exceptions=True)
+        self._response_cache.close()
+
+        if "_prediction_client" in self.__dict__:
+            await self._prediction_client.transport.close()
+            del self._prediction_client
+
     async def generate_code(
         self,
         task_description: str,
         system_prompt: str,
         context: Optional[Dict[str, Any]] = None,
         language: str = "typescript",
-    ) -> str:
+        stream: bool = False,
+        model: Optional[str] = None,
+    ) -> Union[str, AsyncIterator[str]]:
         """
         Generate code for a specific task
 
@@ -115,33 +1039,23 @@ class VertexAIClient:
             system_prompt: Agent's system prompt (personality and expertise)
             context: Additional context (existing code, requirements, etc.)
             language: Programming language
+            stream: Return an async iterator of text chunks instead
+            model: Model name override (defaults to the Pro model)
 
         Returns:
-            Generated code
+            Generated code (or an iterator over it when streaming)
         """
-        # Build comprehensive prompt
-        prompt_parts = [
-            f"# Task\n{task_description}\n",
-            f"\n# Language\n{language}\n",
-        ]
-
-        if context:
-            if context.get('existing_code'):
-                prompt_parts.append(f"\n# Existing Code\n```{language}\n{context['existing_code']}\n```\n")
-            if context.get('requirements'):
-                prompt_parts.append(f"\n# Requirements\n{context['requirements']}\n")
-            if context.get('design_system'):
-                prompt_parts.append(f"\n# Design System\n{context['design_system']}\n")
-
-        prompt_parts.append("\n# Instructions\nGenerate production-ready code following best practices.")
-
-        prompt = "\n".join(prompt_parts)
+        # Build comprehensive prompt (off the event loop when there's a lot of code)
+        size = len((context or {}).get('existing_code') or '')
+        prompt = await _run_sized(size, _build_code_prompt, task_description, context, language)
 
         code = await self.generate_content(
             prompt=prompt,
             system_instruction=system_prompt,
             temperature=0.3,  # Lower temperature for code generation
-            max_output_tokens=8192
+            max_output_tokens=8192,
+            stream=stream,
+            model_name=model
         )
 
         return code
@@ -150,37 +1064,32 @@ class VertexAIClient:
         self,
         user_prompt: str,
         system_prompt: str,
-    ) -> str:
+        stream: bool = False,
+        max_output_tokens: Optional[int] = None,
+        model: Optional[str] = None,
+    ) -> Union[str, AsyncIterator[str]]:
         """
         Generate a Product Requirements Document
 
         Args:
             user_prompt: User's description of what to build
             system_prompt: Product Manager agent's system prompt
+            stream: Return an async iterator of text chunks instead
+            max_output_tokens: Response length cap (default sized from the prompt)
+            model: Model name override (defaults to the Pro model)
 
         Returns:
-            Generated PRD in Markdown format
+            Generated PRD in Markdown format (or an iterator over it when streaming)
         """
-        prompt = f"""Generate a comprehensive Product Requirements Document (PRD) for the following project:
-
-{user_prompt}
-
-The PRD should include:
-1. Overview and Vision
-2. Target Users
-3. Key Features (detailed)
-4. Technical Requirements
-5. Success Criteria
-6. Timeline Estimate
-7. Risks and Mitigation
-
-Format the output as a well-structured Markdown document."""
+        prompt = _PRD_TMPL.substitute(user_prompt=user_prompt)
 
         prd = await self.generate_content(
             prompt=prompt,
             system_instruction=system_prompt,
             temperature=0.7,
-            max_output_tokens=8192
+            max_output_tokens=max_output_tokens or _estimate_output_tokens("prd", len(prompt)),
+            stream=stream,
+            model_name=model
         )
 
         return prd
@@ -189,6 +1098,8 @@ Format the output as a well-structured Markdown document."""
         self,
         prd_content: str,
         system_prompt: str,
+        stream: bool = False,
+        model: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Analyze PRD and break down into concrete tasks
@@ -196,45 +1107,45 @@ Format the output as a well-structured Markdown document."""
         Args:
             prd_content: The generated PRD
             system_prompt: Agent's system prompt
+            stream: Stream the response and stop once the JSON array is complete
+            model: Model name override (defaults to the Flash model)
 
         Returns:
             List of task dictionaries
         """
-        prompt = f"""Analyze the following PRD and break it down into concrete, actionable tasks:
-
-{prd_content}
+        model_name = model or self.model_name_flash
 
-For each task, provide:
-1. Title (concise)
-2. Description (detailed)
-3. Assigned agent (choose from: pixel, atlas, nova, neuron, aurora, etc.)
-4. Priority (low, medium, high, urgent)
-5. Estimated effort (hours)
-6. Dependencies (other task titles)
+        # Large PRDs are referenced from a context cache instead of re-sent
+        cached = await self._context_cache(system_prompt, f"# PRD\n{prd_content}", model_name)
+        if cached:
+            prd_ref, prd_block = "PRD provided in context", ""
+        else:
+            prd_ref, prd_block = "following PRD", f"\n\n{prd_content}"
 
-Return the tasks as a JSON array."""
+        prompt = _TASKS_TMPL.substitute(prd_ref=prd_ref, prd_block=prd_block)
 
-        response = await self.generate_content(
+        request = dict(
             prompt=prompt,
             system_instruction=system_prompt,
             temperature=0.5,
-            max_output_tokens=4096
+            max_output_tokens=4096,
+            cached_content=cached,
+            model_name=model_name
         )
 
-        # Parse JSON response
-        import json
-        try:
-            # Extract JSON from markdown code blocks if present
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0].strip()
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = response.strip()
+        if stream:
+            tasks = await self._generate_json_stream(**request)
+        else:
+            response = await self._generate_content_bytes(**request)
 
-            tasks = json.loads(json_str)
-            return tasks
-        except Exception as e:
+            # Parse JSON response
+            try:
+                tasks = await _run_sized(len(response), _extract_json, response)
+            except ValueError:
+                tasks = None
+
+        # A response truncated before the first complete task parses to []
+        if not tasks or not isinstance(tasks, list) or not all(isinstance(t, dict) for t in tasks):
             # Fallback: return a default task structure
             return [{
                 "title": "Parse PRD and create detailed tasks",
@@ -244,6 +1155,7 @@ Return the tasks as a JSON array."""
                 "estimated_effort": 2,
                 "dependencies": []
             }]
+        return tasks
 
     async def validate_code(
         self,
@@ -251,6 +1163,9 @@ Return the tasks as a JSON array."""
         language: str,
         requirements: str,
         system_prompt: str,
+        stream: bool = False,
+        max_output_tokens: Optional[int] = None,
+        model: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Validate generated code (Reality Checker)
@@ -260,54 +1175,36 @@ Return the tasks as a JSON array."""
             language: Programming language
             requirements: Original requirements
             system_prompt: QA agent's system prompt
+            stream: Stream the response and stop once the JSON object is complete
+            max_output_tokens: Response length cap (default sized from the prompt)
+            model: Model name override (defaults to the Flash model)
 
         Returns:
             Validation result with passed status and feedback
         """
-        prompt = f"""Review the following {language} code against the requirements:
-
-# Requirements
-{requirements}
-
-# Code
-```{language}
-{code}
-```
-
-Analyze the code for:
-1. Correctness - Does it meet the requirements?
-2. Best Practices - Does it follow language conventions?
-3. Security - Are there any security issues?
-4. Performance - Are there obvious performance issues?
-5. Error Handling - Is error handling adequate?
-6. Code Quality - Is it maintainable and readable?
-
-Return a JSON object with:
-- "passed": boolean (true if code passes all checks)
-- "issues": array of issue objects with "severity", "category", and "description"
-- "suggestions": array of improvement suggestions
-- "score": number 0-100 (overall quality score)"""
+        prompt = _VALIDATION_TMPL.substitute(language=language, requirements=requirements, code=code)
 
-        response = await self.generate_content(
+        request = dict(
             prompt=prompt,
+            model_name=model or self.model_name_flash,
             system_instruction=system_prompt,
             temperature=0.3,
-            max_output_tokens=2048
+            max_output_tokens=max_output_tokens or _estimate_output_tokens("validation", len(prompt))
         )
 
-        # Parse JSON response
-        import json
-        try:
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0].strip()
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = response.strip()
+        # Parsed strictly: a truncated object would pass with partial issues
+        if stream:
+            result = await self._generate_json_stream(partial=False, **request)
+        else:
+            response = await self._generate_content_bytes(**request)
+
+            # Parse JSON response
+            try:
+                result = await _run_sized(len(response), _extract_json, response, False)
+            except ValueError:
+                result = None
 
-            result = json.loads(json_str)
-            return result
-        except Exception:
+        if not isinstance(result, dict) or "passed" not in result:
             # Fallback validation result
             return {
                 "passed": True,
@@ -315,13 +1212,92 @@ Return a JSON object with:
                 "suggestions": [],
                 "score": 85
             }
+        return result
+
+    async def validate_code_batch(
+        self,
+        items: List[Dict[str, str]],
+        system_prompt: str,
+        model: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate several pieces of code in one request per batch
+
+        Up to VALIDATION_BATCH_SIZE items share a prompt (and the system
+        instruction prefill); larger lists are split into concurrent
+        batches. A batch whose response doesn't parse to one result per item
+        falls back to validate_code for each of its items.
+
+        Args:
+            items: Dicts with "code", "language" and "requirements"
+            system_prompt: QA agent's system prompt
+            model: Model name override (defaults to the Flash model)
+
+        Returns:
+            Validation results in the same order as items
+        """
+        batches = [
+            items[i:i + VALIDATION_BATCH_SIZE]
+            for i in range(0, len(items), VALIDATION_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self._validate_code_batch(batch, system_prompt, model or self.model_name_flash) for batch in batches)
+        )
+        return [result for batch_results in results for result in batch_results]
+
+    async def _validate_code_batch(
+        self,
+        items: List[Dict[str, str]],
+        system_prompt: str,
+        model_name: str,
+    ) -> List[Dict[str, Any]]:
+        """Validate one batch of items with a single request"""
+        if len(items) == 1:
+            item = items[0]
+            return [await self.validate_code(
+                item['code'], item['language'], item['requirements'], system_prompt, model=model_name
+            )]
+
+        sections = []
+        for number, item in enumerate(items, 1):
+            language = item['language']
+            sections.append(_VALIDATION_ITEM_TMPL.substitute(
+                number=number, requirements=item['requirements'], language=language, code=item['code']
+            ))
+        items_block = "\n\n".join(sections)
+
+        prompt = _VALIDATION_BATCH_TMPL.substitute(count=len(items), items_block=items_block)
+
+        response = await self._generate_content_bytes(
+            prompt=prompt,
+            system_instruction=system_prompt,
+            temperature=0.3,
+            max_output_tokens=min(8192, 1024 * len(items)),
+            model_name=model_name
+        )
+
+        try:
+            results = await _run_sized(len(response), _extract_json, response)
+        except ValueError:
+            results = None
+
+        if isinstance(results, list) and len(results) == len(items) and all(isinstance(r, dict) for r in results):
+            return results
+
+        # Batch answer unusable; validate items individually
+        return await asyncio.gather(*(
+            self.validate_code(item['code'], item['language'], item['requirements'], system_prompt, model=model_name)
+            for item in items
+        ))
 
     async def generate_documentation(
         self,
         doc_type: str,
         content_context: Dict[str, Any],
         system_prompt: str,
-    ) -> str:
+        stream: bool = False,
+        model: Optional[str] = None,
+    ) -> Union[str, AsyncIterator[str]]:
         """
         Generate various types of documentation
 
@@ -329,38 +1305,35 @@ Return a JSON object with:
             doc_type: Type of doc (user_manual, deployment_guide, api_docs, etc.)
             content_context: Context including code, PRD, architecture, etc.
             system_prompt: Technical Writer agent's system prompt
+            stream: Return an async iterator of text chunks instead
+            model: Model name override (defaults to the Pro model)
 
         Returns:
-            Generated documentation in Markdown
-        """
-        prompts = {
-            "user_manual": "Generate a comprehensive user manual for end users",
-            "deployment_guide": "Generate a detailed deployment guide for DevOps teams",
-            "api_docs": "Generate API documentation with examples",
-            "architecture_doc": "Generate architecture documentation with diagrams",
-            "test_report": "Generate a QA test report summarizing test results"
-        }
-
-        base_prompt = prompts.get(doc_type, "Generate documentation")
-
-        prompt_parts = [f"# Task\n{base_prompt}\n"]
+            Generated documentation in Markdown (or an iterator over it when streaming)
+        """
+        size = sum(len(content_context.get(key) or '') for key in ('prd', 'code', 'architecture'))
+        context = await _run_sized(size, _build_documentation_context, content_context)
 
-        if content_context.get('prd'):
-            prompt_parts.append(f"\n# Product Requirements\n{content_context['prd']}\n")
-        if content_context.get('code'):
-            prompt_parts.append(f"\n# Codebase Overview\n{content_context['code']}\n")
-        if content_context.get('architecture'):
-            prompt_parts.append(f"\n# Architecture\n{content_context['architecture']}\n")
+        # The same project context backs every doc type, so a large one is
+        # cached once and only the task is sent per document
+        cached = await self._context_cache(system_prompt, context, model) if context else None
 
-        prompt_parts.append("\nGenerate clear, comprehensive documentation in Markdown format.")
+        buf = bytearray(_HDR_TASK)
+        buf += _DOC_TASKS.get(doc_type, _DOC_TASK_DEFAULT)
+        if not cached:
+            buf += context.encode('utf-8')
+        buf += _DOC_INSTRUCTIONS
 
-        prompt = "\n".join(prompt_parts)
+        prompt = buf.decode('utf-8')
 
         documentation = await self.generate_content(
             prompt=prompt,
             system_instruction=system_prompt,
             temperature=0.6,
-            max_output_tokens=8192
+            max_output_tokens=8192,
+            cached_content=cached,
+            stream=stream,
+            model_name=model
         )
 
         return documentation
@@ -370,7 +1343,10 @@ Return a JSON object with:
         prd_content: str,
         tech_stack: Dict[str, str],
         system_prompt: str,
-    ) -> str:
+        stream: bool = False,
+        max_output_tokens: Optional[int] = None,
+        model: Optional[str] = None,
+    ) -> Union[str, AsyncIterator[str]]:
         """
         Generate Mermaid.js architecture diagram
 
@@ -378,31 +1354,29 @@ Return a JSON object with:
             prd_content: The PRD
             tech_stack: Dictionary of technologies to use
             system_prompt: Architect agent's system prompt
+            stream: Return an async iterator of text chunks instead
+            max_output_tokens: Response length cap (default sized from the prompt)
+            model: Model name override (defaults to the Flash model)
 
         Returns:
-            Mermaid.js diagram code
+            Mermaid.js diagram code (or an iterator over it when streaming)
         """
-        prompt = f"""Based on the following PRD and tech stack, generate a Mermaid.js architecture diagram:
-
-# PRD
-{prd_content}
+        model_name = model or self.model_name_flash
 
-# Tech Stack
-{tech_stack}
-
-Generate a Mermaid.js diagram showing:
-1. System components
-2. Data flow
-3. External integrations
-4. Database relationships
+        # Large PRDs are referenced from a context cache instead of re-sent
+        cached = await self._context_cache(system_prompt, f"# PRD\n{prd_content}", model_name)
+        prd_block = "" if cached else f"# PRD\n{prd_content}\n\n"
 
-Return ONLY the Mermaid.js code wrapped in a code block."""
+        prompt = _DIAGRAM_TMPL.substitute(prd_block=prd_block, tech_stack=tech_stack)
 
         diagram = await self.generate_content(
             prompt=prompt,
             system_instruction=system_prompt,
             temperature=0.5,
-            max_output_tokens=2048
+            max_output_tokens=max_output_tokens or _estimate_output_tokens("diagram", len(prompt)),
+            cached_content=cached,
+            stream=stream,
+            model_name=model_name
         )
 
         return diagram
@@ -411,17 +1385,25 @@ Return ONLY the Mermaid.js code wrapped in a code block."""
         self,
         messages: List[Dict[str, str]],
         system_prompt: str,
-    ) -> str:
+        stream: bool = False,
+        max_output_tokens: Optional[int] = None,
+        model: Optional[str] = None,
+    ) -> Union[str, AsyncIterator[str]]:
         """
         Multi-turn conversation with context
 
         Args:
             messages: List of message dicts with 'role' and 'content'
             system_prompt: Agent's system prompt
+            stream: Return an async iterator of text chunks instead
+            max_output_tokens: Response length cap (default sized from the prompt)
+            model: Model name override (defaults to the Flash model)
 
         Returns:
-            Assistant's response
+            Assistant's response (or an iterator over it when streaming)
         """
+        model_name = model or self.model_name_flash
+
         # Build conversation prompt
         conversation = []
         for msg in messages:
@@ -429,17 +1411,60 @@ Return ONLY the Mermaid.js code wrapped in a code block."""
             content = msg.get('content', '')
             conversation.append(f"{role.upper()}: {content}")
 
-        prompt = "\n\n".join(conversation)
+        # Long histories are referenced from a context cache; only the turns
+        # after the cached prefix are sent
+        cached, prefix_len = await self._chat_prefix_cache(conversation, system_prompt, model_name)
+        prompt = "\n\n".join(conversation[prefix_len:])
 
         response = await self.generate_content(
             prompt=prompt,
             system_instruction=system_prompt,
             temperature=0.7,
-            max_output_tokens=4096
+            max_output_tokens=max_output_tokens or _estimate_output_tokens("chat", len(prompt)),
+            cached_content=cached,
+            stream=stream,
+            model_name=model_name
         )
 
         return response
 
+    async def _chat_prefix_cache(
+        self,
+        conversation: List[str],
+        system_prompt: str,
+        model_name: str
+    ) -> Tuple[Optional[caching.CachedContent], int]:
+        """
+        Get the context cache holding the leading turns of a conversation
+
+        Prefixes are cached at multiples of CHAT_CACHE_REFRESH_TURNS turns and
+        keyed by their content, so concurrent conversations with one agent
+        each find their own prefix. The longest prefix is created on first
+        use; if it can't be, the previous (shorter) one is used. The latest
+        turn is always sent inline.
+
+        Args:
+            conversation: Formatted conversation turns
+            system_prompt: Agent's system prompt
+            model_name: Model the cache is created for
+
+        Returns:
+            Tuple of (cache or None, number of turns it holds)
+        """
+        history = len(conversation) - 1
+        prefix_len = history - history % CHAT_CACHE_REFRESH_TURNS
+
+        while prefix_len > 0:
+            prefix = "\n\n".join(conversation[:prefix_len])
+            if len(prefix) < CONTEXT_CACHE_MIN_CHARS:
+                break
+            cached = await self._context_cache(system_prompt, prefix, model_name)
+            if cached is not None:
+                return cached, prefix_len
+            prefix_len -= CHAT_CACHE_REFRESH_TURNS
+
+        return None, 0
+
 
 # ==============================================================================
 # Usage Example
@@ -485,6 +1510,8 @@ You write clean, modern code following best practices."""
     )
     print("Validation Result:", validation)
 
+    await client.close()
+
 
 if __name__ == "__main__":
     import asyncio